@@ -1,7 +1,12 @@
 from alembic import context
 from config.settings import settings
 from models import Base
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
+from utils.partitioning import (
+    default_partition_name,
+    is_partitioned_sql,
+    parse_partition_name,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -11,6 +16,28 @@ config = context.config
 config.set_main_option("sqlalchemy.url", settings.SQLALCHEMY_DATABASE_URL)
 target_metadata = Base.metadata
 
+
+# refresh_tokens 파티션(partition-tokens 명령으로 만든 테이블)은 모델에 없으므로 autogenerate 비교에서 제외
+def include_name(name, type_, parent_names):
+    if type_ == "table":
+        return not (
+            parse_partition_name("refresh_tokens", name)
+            or name == default_partition_name("refresh_tokens")
+        )
+    return True
+
+
+# 파티션으로 변환한 refresh_tokens는 token_hash unique 인덱스에 expires_at이 포함되므로
+# 모델과 다른 인덱스를 autogenerate 비교에서 제외
+def include_object_for(partitioned_tables):
+    def include_object(object, name, type_, reflected, compare_to):
+        if type_ in ("index", "unique_constraint"):
+            return object.table.name not in partitioned_tables
+        return True
+
+    return include_object
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -34,6 +61,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_name=include_name,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -55,7 +83,18 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        partitioned_tables = (
+            {"refresh_tokens"}
+            if connection.scalar(text(is_partitioned_sql("refresh_tokens")))
+            else set()
+        )
+        connection.commit()  # 조회로 시작된 트랜잭션 종료 (마이그레이션은 아래 트랜잭션에서 실행)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            include_object=include_object_for(partitioned_tables),
+        )
 
         with context.begin_transaction():
             context.run_migrations()
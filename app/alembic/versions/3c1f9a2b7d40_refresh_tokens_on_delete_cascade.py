@@ -0,0 +1,49 @@
+"""cascade refresh token deletion at the database level
+
+Revision ID: 3c1f9a2b7d40
+Revises: ed714eafd000
+Create Date: 2026-10-18 12:20:05.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f9a2b7d40"
+down_revision: Union[str, Sequence[str], None] = "ed714eafd000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. 기존 외래 키 제거
+    op.drop_constraint(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey"
+    )
+
+    # 2. 사용자 삭제 시 DB에서 토큰까지 함께 삭제
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey",
+        "refresh_tokens",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey",
+        "refresh_tokens",
+        "users",
+        ["user_id"],
+        ["id"],
+    )
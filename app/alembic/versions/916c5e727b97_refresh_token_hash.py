@@ -0,0 +1,59 @@
+"""store refresh token sha256 digest instead of raw token
+
+Revision ID: 916c5e727b97
+Revises: 36108d0ac5f2
+Create Date: 2026-10-18 10:12:41.503117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "916c5e727b97"
+down_revision: Union[str, Sequence[str], None] = "36108d0ac5f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. digest 컬럼 추가
+    op.add_column(
+        "refresh_tokens", sa.Column("token_hash", sa.String(64), nullable=True)
+    )
+
+    # 2. 기존 토큰 원문으로 SHA-256 digest 채우기 (set-based)
+    op.execute(
+        "UPDATE refresh_tokens "
+        "SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+
+    # 3. NOT NULL + unique 인덱스, user_id 인덱스
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_refresh_tokens_token_hash"),
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_user_id"), "refresh_tokens", ["user_id"], unique=False
+    )
+
+    # 4. 토큰 원문 컬럼 제거
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 토큰 원문은 복구할 수 없으므로 digest를 채워 넣고 기존 토큰은 모두 revoke
+    op.add_column("refresh_tokens", sa.Column("token", sa.String(), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token = token_hash, revoked = true")
+    op.alter_column("refresh_tokens", "token", nullable=False)
+
+    op.drop_index(op.f("ix_refresh_tokens_user_id"), table_name="refresh_tokens")
+    op.drop_index(op.f("ix_refresh_tokens_token_hash"), table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token_hash")
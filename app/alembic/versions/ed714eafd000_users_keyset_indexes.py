@@ -0,0 +1,55 @@
+"""add users keyset pagination and username prefix indexes
+
+Revision ID: ed714eafd000
+Revises: 916c5e727b97
+Create Date: 2026-10-18 11:02:17.884120
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ed714eafd000"
+down_revision: Union[str, Sequence[str], None] = "916c5e727b97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. keyset 정렬 키에 NULL이 없도록 created_at 채우기
+    op.execute("UPDATE users SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column(
+        "users",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # 2. 페이지네이션 / 필터 인덱스
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+    op.create_index(
+        "ix_users_role_created_at_id", "users", ["role", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_users_username_pattern",
+        "users",
+        ["username"],
+        postgresql_ops={"username": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_username_pattern", table_name="users")
+    op.drop_index("ix_users_role_created_at_id", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.alter_column(
+        "users",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=True,
+    )
@@ -1,25 +1,220 @@
+import itertools
+import time
+from typing import Any
+from uuid import uuid4
+
 from config.settings import settings
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from utils.logger import get_logger
+from utils.metrics import registry
+from utils.query_stats import QueryStats, install_query_stats
+from utils.tracing import install_sql_tracing, record_span
+
+logger = get_logger("app.db")
 
 # 비동기 데이터베이스 URL 생성 (postgresql:// → postgresql+asyncpg://)
 async_database_url = settings.SQLALCHEMY_DATABASE_URL.replace(
     "postgresql://", "postgresql+asyncpg://"
 )
 
-# 비동기 엔진 생성
-async_engine = create_async_engine(
-    async_database_url,
-    pool_pre_ping=True,
-    echo=True,  # 쿼리 로그 활성화
+
+# 커넥션 대기 시간을 기록하는 커넥션 풀
+# - 커넥션 checkout에 걸린 시간(대기 + 신규 연결)과 타임아웃 횟수를 집계
+# - 요청 추적 중이면 checkout 시간을 db_checkout 구간으로 기록
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            record_span("db_checkout", start, wait)
+
+
+# asyncpg 드라이버 연결 옵션
+# - PgBouncer(transaction pooling) 호환 모드에서는 prepared statement 캐시를 끄고
+#   statement 이름을 매번 고유하게 생성
+def _connect_args() -> dict[str, Any]:
+    if settings.DB_PGBOUNCER_MODE:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+# SQL 실행 시간 통계 (느린 쿼리 로그 + 샘플링 로그)
+query_stats = QueryStats(
+    slow_threshold=settings.DB_SLOW_QUERY_SECONDS,
+    sample_rate=settings.DB_QUERY_LOG_SAMPLE_RATE,
+)
+
+
+# 비동기 엔진 생성 (주 DB, 읽기 전용 복제본 공통 설정)
+def _create_engine(url: str, **connect_args: Any) -> AsyncEngine:
+    engine = create_async_engine(
+        url.replace("postgresql://", "postgresql+asyncpg://"),
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={**_connect_args(), **connect_args},
+        echo=settings.DB_ECHO,  # 쿼리 로그 (운영 환경에서는 비활성화)
+    )
+    if settings.DB_QUERY_STATS_ENABLED:
+        install_query_stats(engine.sync_engine, query_stats)
+    install_sql_tracing(engine.sync_engine)
+    return engine
+
+
+async_engine = _create_engine(async_database_url)
+
+
+# 커넥션 풀 상태 반환
+def get_pool_stats(engine: AsyncEngine | None = None) -> dict[str, Any]:
+    pool = (engine or async_engine).pool
+    stats: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "avg_wait": pool.total_wait / pool.checkouts if pool.checkouts else 0.0,
+                "max_wait": pool.max_wait,
+            }
+        )
+    return stats
+
+
+# 커넥션 풀 메트릭
+registry.callback(
+    "db_pool_connections",
+    "커넥션 풀 상태별 커넥션 수",
+    lambda: {
+        (state,): get_pool_stats().get(state, 0)
+        for state in ("size", "checked_in", "checked_out", "overflow")
+    },
+    ("state",),
+)
+registry.callback(
+    "db_pool_checkouts_total",
+    "커넥션 checkout 수",
+    lambda: {(): get_pool_stats().get("checkouts", 0)},
+    type="counter",
+)
+registry.callback(
+    "db_pool_timeouts_total",
+    "커넥션 checkout 타임아웃 수",
+    lambda: {(): get_pool_stats().get("timeouts", 0)},
+    type="counter",
 )
 
+
 # 비동기 세션 생성
 AsyncSessionLocal = async_sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+# 읽기 전용 복제본 라우터
+# - 복제본을 라운드 로빈으로 선택하고, 연결에 실패한 복제본은 retry_after초 동안 제외
+# - 사용 가능한 복제본이 없으면 주 DB 세션 반환
+class ReadReplicaRouter:
+    def __init__(self, urls: list[str], retry_after: float, connect_timeout: float):
+        self.retry_after = retry_after
+        self.fallbacks = 0
+        self._engines = [_create_engine(url, timeout=connect_timeout) for url in urls]
+        self._sessionmakers = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in self._engines
+        ]
+        self._down_until = [0.0] * len(self._engines)
+        self._order = itertools.cycle(range(len(self._engines)))
+
+    # 읽기 세션 반환 (복제본 커넥션을 미리 checkout해서 상태 확인)
+    async def session(self) -> AsyncSession:
+        for _ in range(len(self._engines)):
+            index = next(self._order)
+            if self._down_until[index] > time.monotonic():
+                continue
+
+            session = self._sessionmakers[index]()
+            try:
+                await session.connection()
+                return session
+            except Exception:
+                await session.close()
+                self._down_until[index] = time.monotonic() + self.retry_after
+                logger.warning(
+                    "읽기 복제본 연결 실패 - %s",
+                    self._engines[index].url,
+                    exc_info=True,
+                )
+
+        if self._engines:
+            self.fallbacks += 1
+        return AsyncSessionLocal()
+
+    # 복제본 상태 반환
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "fallbacks": self.fallbacks,
+            "replicas": [
+                {
+                    "url": engine.url.render_as_string(hide_password=True),
+                    "healthy": self._down_until[i] <= now,
+                    "pool": get_pool_stats(engine),
+                }
+                for i, engine in enumerate(self._engines)
+            ],
+        }
+
+    # 복제본 엔진 정리
+    async def dispose(self) -> None:
+        for engine in self._engines:
+            await engine.dispose()
+
+
+read_router = ReadReplicaRouter(
+    [url.strip() for url in settings.DB_REPLICA_URLS.split(",") if url.strip()],
+    retry_after=settings.DB_REPLICA_RETRY_SECONDS,
+    connect_timeout=settings.DB_REPLICA_CONNECT_TIMEOUT,
+)
+
+
 # 데이터베이스 모델 정의
 class Base(DeclarativeBase):
     pass
@@ -32,3 +227,54 @@ async def get_async_db():
             yield session
         finally:
             await session.close()
+
+
+# 읽기 전용 데이터베이스 세션 생성 (복제본 우선, 없으면 주 DB)
+async def get_read_async_db():
+    session = await read_router.session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+# 지연 세션 사용 통계
+# - requests: 지연 세션을 받은 요청 수
+# - untouched: 세션을 한 번도 사용하지 않고 끝난 요청 수
+lazy_session_stats = {"requests": 0, "untouched": 0}
+
+
+# 처음 사용할 때 세션을 만드는 지연 세션
+# - 유효한 액세스 토큰처럼 DB가 필요 없는 경로에서는 세션/커넥션을 만들지 않음
+class LazyAsyncSession:
+    def __init__(self):
+        self._session: AsyncSession | None = None
+
+    # 세션 사용 여부
+    @property
+    def used(self) -> bool:
+        return self._session is not None
+
+    # 세션 반환 (처음 호출 시 생성)
+    def get(self) -> AsyncSession:
+        if self._session is None:
+            self._session = AsyncSessionLocal()
+        return self._session
+
+    # 생성된 세션이 있으면 닫기
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+# 지연 데이터베이스 세션 생성
+async def get_lazy_async_db():
+    lazy_session = LazyAsyncSession()
+    lazy_session_stats["requests"] += 1
+    try:
+        yield lazy_session
+    finally:
+        if not lazy_session.used:
+            lazy_session_stats["untouched"] += 1
+        await lazy_session.close()
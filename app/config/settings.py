@@ -1,15 +1,78 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from utils.path import BASE_DIR
 
 
 class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URL: str  # 데이터베이스 URL
+    DB_REPLICA_URLS: str = ""  # 읽기 전용 복제본 URL 목록 (콤마로 구분)
+    DB_REPLICA_RETRY_SECONDS: float = 30  # 연결 실패한 복제본 재시도 대기 시간 (초)
+    DB_REPLICA_CONNECT_TIMEOUT: float = 5  # 복제본 연결 타임아웃 (초)
+    # 사용자 변경 후 로그인을 주 DB에서 처리하는 시간 (초, 복제 지연 최대값)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 10
+    DB_POOL_SIZE: int = 5  # 커넥션 풀 크기
+    DB_MAX_OVERFLOW: int = 10  # 풀 크기를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30  # 커넥션 대기 타임아웃 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재사용 최대 시간 (초, -1이면 비활성화)
+    DB_POOL_PRE_PING: bool = True  # checkout 시 커넥션 상태 확인 여부
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statement 캐시 크기
+    DB_PGBOUNCER_MODE: bool = False  # PgBouncer(transaction pooling) 호환 모드
+    DB_ECHO: bool = False  # SQL 쿼리 로그 출력 여부
+    DB_QUERY_STATS_ENABLED: bool = True  # SQL 실행 시간 통계 수집 여부
+    DB_SLOW_QUERY_SECONDS: float = 0.2  # 느린 쿼리 로그 기준 (초)
+    DB_QUERY_LOG_SAMPLE_RATE: float = 0.0  # 일반 쿼리 로그 샘플링 비율 (0~1)
+
+    METRICS_ENABLED: bool = True  # 요청 메트릭 수집 여부
+    METRICS_ALLOWED_NETWORKS: str = "127.0.0.1/32,::1/128"  # /metrics 허용 네트워크
+
+    TRACE_ENABLED: bool = False  # 요청 구간 추적 여부
+    TRACE_SERVER_TIMING: bool = False  # 추적 결과를 Server-Timing 헤더로 응답
+    TRACE_SLOW_SECONDS: float = 0.1  # 느린 요청 Trace 보관 기준 (초)
+    TRACE_BUFFER_SIZE: int = 100  # 보관할 느린 요청 Trace 수
+
+    TEMPLATE_AUTO_RELOAD: bool = False  # 템플릿 변경 시 다시 로드 (개발용)
+    TEMPLATE_PAGE_CACHE_SIZE: int = 256  # 렌더링된 페이지 캐시 크기 (0이면 사용 안 함)
+
+    LOG_FORMAT: Literal["text", "json"] = "text"  # 로그 출력 형식
+    LOG_SAMPLE_RATES: str = ""  # 로거별 샘플링 비율 (예: app.main=0.1,app.db=0.5)
+    ERROR_LOG_INTERVAL_SECONDS: float = 60  # 에러 응답 로그 집계 주기 (초)
+    ERROR_LOG_MAX_PATHS: int = 100  # 집계할 최대 경로 수 (나머지는 <other>)
 
     JWT_SECRET_KEY: str  # JWT 비밀 키
     JWT_ACCESS_EXPIRES_IN_HOURS: float  # JWT 액세스 토큰 만료 시간 (시간 단위)
     JWT_REFRESH_EXPIRES_IN_DAYS: float  # JWT 리프레시 토큰 만료 시간 (일 단위)
     JWT_ALGORITHM: str = "HS256"  # JWT 알고리즘
 
+    TOKEN_CACHE_ENABLED: bool = True  # 검증된 액세스 토큰 캐시 사용 여부
+    TOKEN_CACHE_MAX_SIZE: int = 10000  # 검증된 액세스 토큰 캐시 최대 크기
+    TOKEN_REFRESH_GRACE_SECONDS: float = 10  # 회전된 리프레시 토큰 유예 시간 (초)
+
+    CACHE_INVALIDATION_ENABLED: bool = True  # 워커 간 캐시 무효화 버스 사용 여부
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"  # LISTEN/NOTIFY 채널
+
+    USER_CACHE_ENABLED: bool = True  # 사용자 조회 캐시 사용 여부
+    USER_CACHE_TTL_SECONDS: float = 60  # 사용자 조회 캐시 유지 시간 (초)
+    USER_CACHE_MAX_SIZE: int = 10000  # 사용자 조회 캐시 최대 크기
+    USER_CACHE_EXCLUDE_FIELDS: str = (
+        "password"  # 캐시에 저장하지 않을 필드 (콤마로 구분)
+    )
+
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt 프로세스 풀 워커 수
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # bcrypt 프로세스 풀 최대 대기 작업 수
+
+    USER_IMPORT_CHUNK_SIZE: int = 1000  # 사용자 일괄 등록 청크 크기 (행)
+    USER_IMPORT_HASH_BATCH_SIZE: int = 32  # 해시 작업 하나에 묶는 비밀번호 수
+    # 일괄 등록이 동시에 사용하는 해시 작업 수
+    # - 분당 등록 수 ≈ 값 × 60 / 해시 시간(cost 12에서 약 0.3초), README 참고
+    USER_IMPORT_HASH_CONCURRENCY: int = 1
+
+    TOKEN_PURGE_ENABLED: bool = True  # 만료/취소 토큰 주기적 정리 사용 여부
+    TOKEN_PURGE_INTERVAL_SECONDS: float = 3600  # 토큰 정리 주기 (초)
+    TOKEN_PURGE_BATCH_SIZE: int = 1000  # 토큰 정리 배치 크기
+    TOKEN_PURGE_BATCH_PAUSE_SECONDS: float = 0.1  # 토큰 정리 배치 사이 대기 시간 (초)
+    TOKEN_PARTITION_PREMAKE: int = 2  # 최대 만료 시각 이후로 미리 만들 파티션 수
+
     model_config = SettingsConfigDict(
         env_file=str(BASE_DIR / ".env"), env_file_encoding="utf-8", case_sensitive=False
     )
@@ -1,110 +1,86 @@
-import time
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import aiofiles
 import routers.admin as admin_router
 import routers.auth as auth_router
 import routers.mypage as mypage_router
+from config.db import read_router
 from config.settings import settings
 from fastapi import Depends, FastAPI, Request, UploadFile
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from schemas.user import UserResponse
-from utils.deps import get_current_user_async, require_admin_async
+from services.auth_service import password_pool
+from services.maintenance_service import run_token_purge_loop
+from utils.deps import (
+    get_current_user_async,
+    require_admin_async,
+    require_metrics_access,
+)
 from utils.error_handlers import (
+    error_log,
     forbidden_error,
     internal_server_error,
     not_found_error,
     unauthorized_error,
 )
-from utils.logger import main_logger
-from utils.path import BASE_DIR, UPLOAD_DIR, templates
+from utils.http_cache import etag_matches
+from utils.invalidation_bus import invalidation_bus
+from utils.metrics import registry
+from utils.middleware import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    TokenRefreshMiddleware,
+    TracingMiddleware,
+)
+from utils.path import UPLOAD_DIR, templates
+from utils.static_assets import service_worker, static_assets
+
+
+# 애플리케이션 수명 주기
+# - 시작 시 만료/취소 토큰 정리 스케줄러, 에러 로그 주기 기록, 캐시 무효화 버스 실행
+# - 종료 시 스케줄러/버스 중지, bcrypt 프로세스 풀 / 읽기 복제본 엔진 정리, 집계 중인 에러 로그 기록
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.CACHE_INVALIDATION_ENABLED:
+        invalidation_bus.start()
+
+    tasks = [asyncio.create_task(error_log.run())]
+    if settings.TOKEN_PURGE_ENABLED:
+        tasks.append(asyncio.create_task(run_token_purge_loop()))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await invalidation_bus.stop()
+    password_pool.shutdown()
+    await read_router.dispose()
+    error_log.flush()
+
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
+    lifespan=lifespan,
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
 )
 
 
-# HTTP 요청 로깅 미들웨어
-# - 모든 HTTP 요청과 응답을 로깅 (health check 제외)
-# - 요청 시간, 메서드, URL, 상태 코드, 응답 시간 등을 기록
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next) -> Response:
-    # health check 경로는 로깅하지 않음
-    if request.url.path == "/health":
-        return await call_next(request)
-
-    # 요청 시작 시간 기록
-    start_time = time.time()
-
-    # 요청 정보 로깅
-    main_logger.info(
-        f"요청 시작 - {request.method} {request.url.path} "
-        f"클라이언트: {request.client.host if request.client else 'Unknown'} "
-        f"User-Agent: {request.headers.get('user-agent', 'Unknown')}"
-    )
-
-    try:
-        # 다음 미들웨어 또는 엔드포인트 실행
-        response = await call_next(request)
-
-        # 응답 시간 계산
-        process_time = time.time() - start_time
-
-        # 성공 응답 로깅
-        main_logger.info(
-            f"요청 완료 - {request.method} {request.url.path} "
-            f"상태: {response.status_code} "
-            f"처리시간: {process_time:.3f}초"
-        )
-
-        return response
-
-    except Exception as e:
-        # 에러 발생 시 로깅
-        process_time = time.time() - start_time
-        main_logger.error(
-            f"요청 실패 - {request.method} {request.url.path} "
-            f"에러: {str(e)} "
-            f"처리시간: {process_time:.3f}초"
-        )
-        raise e
-
-
-# 토큰 갱신 미들웨어
-# - 액세스 토큰과 리프레시 토큰을 쿠키에 설정
-@app.middleware("http")
-async def token_refresh_middleware(request: Request, call_next) -> Response:
-    response = await call_next(request)
-
-    # request.state에 새로운 토큰이 있으면 쿠키에 설정
-    if hasattr(request.state, "new_access_token") and request.state.new_access_token:
-        main_logger.info(f"액세스 토큰 갱신 - {request.method} {request.url.path}")
-        response.set_cookie(
-            key="access_token",
-            value=request.state.new_access_token,
-            httponly=True,
-            secure=True,
-            samesite="strict",
-            max_age=int(settings.JWT_ACCESS_EXPIRES_IN_HOURS * 3600),  # 시간 → 초
-        )
-
-    if hasattr(request.state, "new_refresh_token") and request.state.new_refresh_token:
-        main_logger.info(f"리프레시 토큰 갱신 - {request.method} {request.url.path}")
-        response.set_cookie(
-            key="refresh_token",
-            value=request.state.new_refresh_token,
-            httponly=True,
-            secure=True,
-            samesite="strict",
-            max_age=int(settings.JWT_REFRESH_EXPIRES_IN_DAYS * 24 * 3600),  # 일 → 초
-        )
-
-    return response
+# 미들웨어 등록 (나중에 추가한 미들웨어가 바깥쪽에서 실행)
+# - LoggingMiddleware: 요청/응답 로깅
+# - TokenRefreshMiddleware: 갱신된 토큰을 응답 쿠키로 설정
+# - MetricsMiddleware: 요청 수 / 처리 시간 메트릭
+# - TracingMiddleware: 요청 구간 추적, Server-Timing 헤더
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(TokenRefreshMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
 
 
 # 라우터 포함
@@ -113,7 +89,20 @@ app.include_router(admin_router.router, prefix="/admin", tags=["admin"])
 app.include_router(mypage_router.router, prefix="/mypage", tags=["mypage"])
 
 # 정적 파일 서비스 마운트
-app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
+# - 템플릿에서는 asset("css/base.css")로 해시가 들어간 URL 사용
+# - asset_import_map: JS 모듈의 상대 경로 import를 해시 URL로 연결
+app.mount("/static", static_assets, name="static")
+templates.env.globals["asset"] = static_assets.url
+templates.env.globals["asset_import_map"] = static_assets.import_map()
+
+# 템플릿 설정
+# - 시작할 때 모든 템플릿을 미리 컴파일 (바이트코드 캐시 사용)
+# - TEMPLATE_AUTO_RELOAD(개발용)가 아니면 렌더링 결과 캐시 사용
+templates.configure(
+    auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+    page_cache_size=settings.TEMPLATE_PAGE_CACHE_SIZE,
+)
+templates.precompile()
 
 
 # 메인 페이지 엔드포인트
@@ -121,14 +110,14 @@ app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 async def mainPage(
     request: Request,
 ) -> HTMLResponse:
-    return templates.TemplateResponse(request, "index.html")
+    return templates.cached_response(request, "index.html")
 
 
 @app.get("/introduction")
 async def introduction(
     request: Request,
 ) -> HTMLResponse:
-    return templates.TemplateResponse(request, "introduction.html")
+    return templates.cached_response(request, "introduction.html")
 
 
 # 파일 업로드 엔드포인트
@@ -167,28 +156,42 @@ async def health_check() -> dict:
     return {"status": "ok"}
 
 
+# 메트릭 엔드포인트 (Prometheus 텍스트 형식)
+# - METRICS_ALLOWED_NETWORKS에서 온 요청 또는 관리자만 접근 가능
+@app.get(
+    "/metrics",
+    dependencies=[Depends(require_metrics_access)],
+    include_in_schema=False,
+)
+async def metrics() -> Response:
+    return Response(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # 통합 예외처리
+# - HTML을 받지 않는 클라이언트에는 JSON, 브라우저에는 에러 페이지
 # - 401: 인증 실패
 # - 403: 권한 없음
 # - 404: 페이지 없음
 # - 500: 서버 오류
 @app.exception_handler(401)
-async def unauthorized(request: Request, exc) -> HTMLResponse:
+async def unauthorized(request: Request, exc) -> Response:
     return unauthorized_error(request, exc)
 
 
 @app.exception_handler(403)
-async def forbidden(request: Request, exc) -> HTMLResponse:
+async def forbidden(request: Request, exc) -> Response:
     return forbidden_error(request, exc)
 
 
 @app.exception_handler(404)
-async def not_found(request: Request, exc) -> HTMLResponse:
+async def not_found(request: Request, exc) -> Response:
     return not_found_error(request, exc)
 
 
 @app.exception_handler(500)
-async def internal_server_error_handler(request: Request, exc) -> HTMLResponse:
+async def internal_server_error_handler(request: Request, exc) -> Response:
     return internal_server_error(request, exc)
 
 
@@ -225,9 +228,14 @@ async def custom_openapi() -> JSONResponse:
     )
 
 
+# 서비스 워커 스크립트
+# - 배포 버전과 사전 캐시 목록이 들어간 스크립트, 버전을 ETag로 사용
+# - 브라우저가 업데이트를 바로 확인하도록 no-cache
 @app.get("/service-worker.js", include_in_schema=False)
-async def service_worker() -> FileResponse:
-    return FileResponse(
-        BASE_DIR / "static" / "service-worker.js",
-        media_type="application/javascript",
+async def service_worker_script(request: Request) -> Response:
+    headers = {"Cache-Control": "no-cache", "ETag": service_worker.etag}
+    if etag_matches(request.headers.get("if-none-match", ""), service_worker.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        service_worker.body, media_type="application/javascript", headers=headers
     )
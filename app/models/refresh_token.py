@@ -11,14 +11,23 @@ if TYPE_CHECKING:
 
 
 # 리프레시 토큰 모델
+# - partition-tokens 명령으로 expires_at 기준 파티션 테이블로 변환한 경우에만 DB의 기본 키와
+#   token_hash unique 인덱스에 expires_at이 포함됨 (파티션 테이블의 unique 제약은 파티션 키를 포함해야 함)
+# - 그때는 DB가 token_hash 단독 중복을 막지 않으며, token_hash가 무작위 토큰의 digest라는 점에만 의존함
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid4())
     )
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
-    token: Mapped[str] = mapped_column(String, nullable=False)
+    # 사용자 삭제 시 DB에서 함께 삭제 (ON DELETE CASCADE)
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    # 토큰 원문 대신 SHA-256 digest(hex)를 저장하고 조회에 사용
+    token_hash: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True, nullable=False
+    )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -4,7 +4,7 @@ from uuid import uuid4
 
 from config.db import Base
 from models.enums import UserRole
-from sqlalchemy import DateTime, Enum, String, func
+from sqlalchemy import DateTime, Enum, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -14,6 +14,17 @@ if TYPE_CHECKING:
 # 사용자 모델
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 관리자 사용자 목록 keyset 페이지네이션 (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_role_created_at_id", "role", "created_at", "id"),
+        # username 접두어 검색 (LIKE 'prefix%')
+        Index(
+            "ix_users_username_pattern",
+            "username",
+            postgresql_ops={"username": "varchar_pattern_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid4())
@@ -27,12 +38,16 @@ class User(Base):
         Enum(UserRole), nullable=False, default=UserRole.MEMBER
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now()
     )
 
+    # 토큰 삭제는 DB의 ON DELETE CASCADE에 맡기고 ORM에서 토큰을 불러오지 않음
     refresh_tokens: Mapped[list["RefreshToken"]] = relationship(
-        "RefreshToken", back_populates="user", cascade="all, delete-orphan"
+        "RefreshToken",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -1,13 +1,26 @@
-from typing import Any
+from typing import Any, Literal
 
 import services.admin_service as admin_service
-from config.db import get_async_db
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
-from schemas.admin import ModifyUser
-from schemas.user import UserResponse
+import services.import_service as import_service
+from config.db import (
+    get_async_db,
+    get_pool_stats,
+    lazy_session_stats,
+    query_stats,
+    read_router,
+)
+from config.settings import settings
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from models.enums import UserRole
+from schemas.admin import BatchUserOperations, ModifyUser
+from services import jwt_service
+from services.auth_service import password_pool, user_cache_stats
+from services.maintenance_service import token_purge_stats
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.deps import require_admin_async
+from utils.invalidation_bus import invalidation_bus
+from utils.middleware import slow_traces
 from utils.path import templates
 
 router = APIRouter(dependencies=[Depends(require_admin_async)])
@@ -17,15 +30,85 @@ router = APIRouter(dependencies=[Depends(require_admin_async)])
 async def admin_page(
     request: Request,
 ) -> HTMLResponse:
-    return templates.TemplateResponse(request, "admin.html")
+    return templates.cached_response(request, "admin.html")
 
 
+# 사용자 목록 조회
+# - cursor: 이전 응답의 next_cursor (keyset 페이지네이션)
+# - role, username: 역할 / username 접두어 필터
+# - format=ndjson: 전체 결과를 한 줄에 한 명씩 스트리밍
+# - 읽기 세션은 JSON 응답에서만 열고, 스트리밍은 자체 읽기 세션 사용
+#   (의존성으로 받으면 스트리밍 중에 쓰지 않는 커넥션을 하나 더 잡고 있음)
 @router.get("/user")
 async def get_users(
-    db: AsyncSession = Depends(get_async_db),
-) -> dict:
-    users: list[UserResponse] = await admin_service.get_all_users(db)
-    return {"users": [u.model_dump() for u in users]}
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    role: UserRole | None = None,
+    username: str | None = Query(None, max_length=100),
+    format: Literal["json", "ndjson"] = "json",
+) -> Response:
+    if format == "ndjson":
+        return StreamingResponse(
+            admin_service.stream_users_ndjson(role, username, cursor),
+            media_type="application/x-ndjson",
+        )
+
+    db = await read_router.session()
+    try:
+        users, next_cursor = await admin_service.get_users_page(
+            db, limit=limit, cursor=cursor, role=role, username_prefix=username
+        )
+    finally:
+        await db.close()
+    return JSONResponse(
+        {
+            "users": [u.model_dump(mode="json") for u in users],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+# 서버 내부 상태 통계
+# - token_cache: 검증된 액세스 토큰 캐시
+# - password_hashing: bcrypt 프로세스 풀
+# - token_purge: 만료/취소 토큰 정리 작업
+# - lazy_db_sessions: 인증 의존성의 지연 세션 (untouched = DB를 사용하지 않은 요청)
+# - db_pool: 커넥션 풀 사용량과 checkout 대기 시간
+# - read_replicas: 읽기 전용 복제본 상태
+# - user_cache: 사용자 조회 캐시
+# - invalidation_bus: 워커 간 캐시 무효화 버스
+# - page_cache: 렌더링된 페이지 캐시
+@router.get("/stats")
+async def get_stats() -> dict[str, Any]:
+    return {
+        "token_cache": jwt_service.verified_token_cache.stats(),
+        "password_hashing": password_pool.stats(),
+        "token_purge": token_purge_stats,
+        "lazy_db_sessions": lazy_session_stats,
+        "db_pool": get_pool_stats(),
+        "read_replicas": read_router.stats(),
+        "user_cache": user_cache_stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+        "page_cache": templates.pages.stats(),
+    }
+
+
+# SQL 실행 시간 통계 (총 실행 시간 기준 상위 N개)
+@router.get("/stats/queries")
+async def get_query_stats(limit: int = Query(20, ge=1, le=200)) -> dict[str, Any]:
+    return {"slow_count": query_stats.slow_count, "queries": query_stats.top(limit)}
+
+
+# 최근 느린 요청 Trace (처리 시간이 긴 순서)
+# - TRACE_ENABLED일 때 TRACE_SLOW_SECONDS 이상 걸린 요청의 구간별 소요 시간
+@router.get("/traces")
+async def get_traces(limit: int = Query(20, ge=1, le=200)) -> dict[str, Any]:
+    return {
+        "enabled": settings.TRACE_ENABLED,
+        "slow_seconds": settings.TRACE_SLOW_SECONDS,
+        "recorded": slow_traces.recorded,
+        "traces": slow_traces.slowest(limit),
+    }
 
 
 # 사용자 수정
@@ -46,6 +129,31 @@ async def admin_modify_user(
     }
 
 
+# 사용자 일괄 수정/삭제 (하나의 트랜잭션)
+@router.post("/user/batch")
+async def admin_batch_users(
+    batch: BatchUserOperations, db: AsyncSession = Depends(get_async_db)
+) -> dict[str, Any]:
+    results = await admin_service.db_batch(db, batch.operations)
+    return {
+        "status": "success",
+        "applied": sum(1 for r in results if r.status == "success"),
+        "results": [r.model_dump() for r in results],
+    }
+
+
+# 사용자 일괄 등록 (CSV 또는 NDJSON 스트리밍 업로드)
+# - csv: username, password 컬럼을 포함한 헤더 필요
+# - 행 번호별 오류 보고서 반환
+@router.post("/user/import")
+async def admin_import_users(
+    request: Request,
+    format: Literal["csv", "ndjson"] = "csv",
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any]:
+    return await import_service.import_users(db, request.stream(), format)
+
+
 # 사용자 삭제
 @router.delete("/user")
 async def admin_delete_member(
@@ -1,10 +1,11 @@
-from config.db import get_async_db
+from config.db import get_async_db, get_read_async_db
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from schemas.user import ChangePassword, UserCreate, UserLogin, UserResponse
 from services import auth_service, jwt_service
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.deps import (
+    forget_rotated_refresh_token,
     get_current_user_async,
     get_current_user_optional_async,
     get_refresh_token,
@@ -29,18 +30,25 @@ async def login_form(
 ) -> HTMLResponse:
     if user:
         return RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
-    return templates.TemplateResponse(request, "login.html")
+    return templates.cached_response(request, "login.html")
 
 
 # 로그인 (비동기)
+# - 사용자 조회는 읽기 복제본, refresh token 저장은 주 DB에서 처리
+# - 복제 지연으로 복제본 결과가 오래된 경우는 주 DB로 확인 (authenticate_user_replica_async)
 @router.post("/login")
 async def login(
-    request: Request, user_login: UserLogin, db: AsyncSession = Depends(get_async_db)
+    request: Request,
+    user_login: UserLogin,
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_read_async_db),
 ) -> JSONResponse:
     username = user_login.username
     password = user_login.password
 
-    user = await auth_service.authenticate_user_async(db, username, password)
+    user = await auth_service.authenticate_user_replica_async(
+        read_db, db, username, password
+    )
 
     if not user:
         raise HTTPException(
@@ -70,7 +78,7 @@ async def register_form(
 ) -> HTMLResponse:
     if user:
         return RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
-    return templates.TemplateResponse(request, "register.html")
+    return templates.cached_response(request, "register.html")
 
 
 # 회원가입 (비동기)
@@ -106,7 +114,7 @@ async def register(
 async def change_password_form(
     request: Request, user: UserResponse = Depends(get_current_user_async)
 ) -> HTMLResponse:
-    return templates.TemplateResponse(request, "changepw.html")
+    return templates.cached_response(request, "changepw.html")
 
 
 # 비밀번호 변경 (비동기)
@@ -135,6 +143,7 @@ async def logout(
     refresh_token: str = Depends(get_refresh_token),
 ) -> JSONResponse:
     await jwt_service.revoke_refresh_token_async(db, refresh_token)
+    forget_rotated_refresh_token(refresh_token)
 
     response = JSONResponse(
         status_code=status.HTTP_200_OK,
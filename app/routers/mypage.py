@@ -12,4 +12,4 @@ router = APIRouter()
 async def mypage(
     request: Request, user: UserResponse = Depends(get_current_user_async)
 ) -> HTMLResponse:
-    return templates.TemplateResponse(request, "mypage.html")
+    return templates.cached_response(request, "mypage.html")
@@ -1,7 +1,7 @@
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from models.user import User
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 protected_fields = {"password", "id"}
@@ -44,3 +44,33 @@ class ModifyUser(BaseModel):
             raise ValueError(f"Value '{v}' is not valid for type '{expected_type}'.")
 
         raise ValueError(f"Unsupported type '{expected_type}' specified.")  # fallback
+
+
+# 일괄 처리 - 사용자 수정
+class ModifyUserOperation(ModifyUser):
+    op: Literal["modify"]
+
+
+# 일괄 처리 - 사용자 삭제
+class DeleteUserOperation(BaseModel):
+    op: Literal["delete"]
+    userid: str
+
+
+UserOperation = Annotated[
+    ModifyUserOperation | DeleteUserOperation, Field(discriminator="op")
+]
+
+
+# 사용자 일괄 수정/삭제 요청
+class BatchUserOperations(BaseModel):
+    operations: list[UserOperation] = Field(min_length=1, max_length=1000)
+
+
+# 일괄 처리 항목별 결과
+class BatchOperationResult(BaseModel):
+    index: int
+    op: Literal["modify", "delete"]
+    userid: str
+    status: Literal["success", "error"]
+    detail: str | None = None
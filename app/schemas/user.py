@@ -37,6 +37,12 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# 사용자 조회 캐시에 저장되는 사용자 정보
+# - 캐시에서 제외하도록 설정된 필드(기본: password)는 None
+class CachedUser(UserResponse):
+    password: str | None = None
+
+
 # User 모델을 UserResponse로 변환하는 헬퍼 함수
 def user_to_response(user: User) -> UserResponse:
     return UserResponse.model_validate(user)
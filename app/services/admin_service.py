@@ -1,17 +1,106 @@
-from typing import Any
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator
 
+from config.db import read_router
 from fastapi import HTTPException, status
+from models.enums import UserRole
 from models.user import User
+from schemas.admin import (
+    BatchOperationResult,
+    DeleteUserOperation,
+    ModifyUserOperation,
+    UserOperation,
+)
 from schemas.user import UserResponse, user_to_response
-from sqlalchemy import select
+from services.auth_service import (
+    delete_user_async,
+    invalidate_user_async,
+    invalidate_user_cache,
+)
+from sqlalchemy import Select, delete, select, tuple_, update
+from sqlalchemy.exc import IntegrityError, StatementError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-# 모든 사용자 조회
-async def get_all_users(db: AsyncSession) -> list[UserResponse]:
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return [user_to_response(user) for user in users]
+# 페이지 커서 인코딩 (마지막 사용자의 created_at, id)
+def encode_cursor(created_at: datetime, user_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), user_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+# 페이지 커서 디코딩
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+# 사용자 목록 쿼리 생성
+# - (created_at, id) 순서의 keyset 페이지네이션
+# - role, username 접두어 필터
+def _users_query(
+    role: UserRole | None, username_prefix: str | None, cursor: str | None
+) -> Select:
+    stmt = select(
+        User.id, User.username, User.role, User.created_at, User.updated_at
+    ).order_by(User.created_at, User.id)
+    if role:
+        stmt = stmt.filter(User.role == role)
+    if username_prefix:
+        stmt = stmt.filter(User.username.startswith(username_prefix, autoescape=True))
+    if cursor:
+        stmt = stmt.filter(tuple_(User.created_at, User.id) > decode_cursor(cursor))
+    return stmt
+
+
+# 사용자 목록 페이지 조회
+# - (사용자 목록, 다음 페이지 커서) 반환, 마지막 페이지면 커서는 None
+async def get_users_page(
+    db: AsyncSession,
+    limit: int = 50,
+    cursor: str | None = None,
+    role: UserRole | None = None,
+    username_prefix: str | None = None,
+) -> tuple[list[UserResponse], str | None]:
+    result = await db.execute(
+        _users_query(role, username_prefix, cursor).limit(limit + 1)
+    )
+    rows = result.all()
+    users = [UserResponse.model_validate(row) for row in rows[:limit]]
+
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(users[-1].created_at, users[-1].id)  # type: ignore
+    return users, next_cursor
+
+
+# 사용자 목록 NDJSON 스트리밍
+# - 서버 사이드 커서로 한 줄씩 전송하므로 전체 목록을 메모리에 올리지 않음
+# - 응답 전송 중에도 세션이 유지되어야 하므로 자체 읽기 세션 사용
+def stream_users_ndjson(
+    role: UserRole | None = None,
+    username_prefix: str | None = None,
+    cursor: str | None = None,
+) -> AsyncIterator[str]:
+    # 잘못된 커서는 응답 시작 전에 400으로 처리
+    stmt = _users_query(role, username_prefix, cursor).execution_options(yield_per=500)
+
+    async def generate() -> AsyncIterator[str]:
+        session = await read_router.session()
+        try:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield UserResponse.model_validate(row).model_dump_json() + "\n"
+        finally:
+            await session.close()
+
+    return generate()
 
 
 # 사용자 업데이트
@@ -21,10 +110,13 @@ async def db_update(
     result = await db.execute(select(User).filter(User.id == userid))
     user = result.scalar_one_or_none()
     if user:
+        # username이 바뀔 수 있으므로 변경 전 값으로 무효화
+        invalidate_user_cache(user_id=user.id, username=user.username)
         for key, value in update_data.items():
             setattr(user, key, value)
         await db.commit()
         await db.refresh(user)
+        await invalidate_user_async(user.id, user.username)
         return user_to_response(user)
     else:
         raise HTTPException(
@@ -34,13 +126,89 @@ async def db_update(
 
 # 사용자 삭제
 async def db_delete(db: AsyncSession, userid: str) -> UserResponse:
-    result = await db.execute(select(User).filter(User.id == userid))
-    user = result.scalar_one_or_none()
-    if user:
-        await db.delete(user)
+    return await delete_user_async(db, userid)
+
+
+# 사용자 일괄 수정/삭제
+# - 대상 사용자를 한 번에 조회(FOR UPDATE)해서 모든 항목을 먼저 검증
+# - 같은 사용자/속성을 여러 번 수정하면 마지막 값만 적용
+# - (속성, 값)이 같은 수정은 UPDATE 한 번, 삭제는 DELETE 한 번으로 처리
+# - 전체를 하나의 트랜잭션으로 커밋하고 항목별 결과 반환
+# - 존재하지 않는 사용자, 앞에서 삭제된 사용자에 대한 항목은 error로 표시하고 건너뜀
+async def db_batch(
+    db: AsyncSession, operations: list[UserOperation]
+) -> list[BatchOperationResult]:
+    userids = {operation.userid for operation in operations}
+    result = await db.execute(
+        select(User.id, User.username).filter(User.id.in_(userids)).with_for_update()
+    )
+    usernames = dict(result.tuples().all())
+
+    results: list[BatchOperationResult] = []
+    updates: dict[tuple[str, str], Any] = {}
+    deletes: set[str] = set()
+    for index, operation in enumerate(operations):
+        detail = None
+        if operation.userid not in usernames:
+            detail = "User not found"
+        elif operation.userid in deletes:
+            detail = "User already deleted in this batch"
+        elif isinstance(operation, ModifyUserOperation):
+            updates[(operation.userid, operation.attr)] = operation.value
+        elif isinstance(operation, DeleteUserOperation):
+            deletes.add(operation.userid)
+
+        results.append(
+            BatchOperationResult(
+                index=index,
+                op=operation.op,
+                userid=operation.userid,
+                status="error" if detail else "success",
+                detail=detail,
+            )
+        )
+
+    # 삭제될 사용자의 수정은 적용할 필요가 없음
+    grouped: dict[tuple[str, Any], list[str]] = {}
+    for (userid, attr), value in updates.items():
+        if userid not in deletes:
+            grouped.setdefault((attr, value), []).append(userid)
+
+    # username이 바뀔 수 있으므로 변경 전 값으로 무효화
+    changed = {userid for ids in grouped.values() for userid in ids} | deletes
+    for userid in changed:
+        invalidate_user_cache(user_id=userid, username=usernames[userid])
+
+    try:
+        for (attr, value), ids in grouped.items():
+            await db.execute(
+                update(User)
+                .where(User.id.in_(ids))
+                .values({attr: value})
+                .execution_options(synchronize_session=False)
+            )
+        if deletes:
+            # 리프레시 토큰은 ON DELETE CASCADE로 함께 삭제
+            await db.execute(
+                delete(User)
+                .where(User.id.in_(deletes))
+                .execution_options(synchronize_session=False)
+            )
         await db.commit()
-        return user_to_response(user)
-    else:
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="User not found"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Batch conflicts with existing users",
+        )
+    except StatementError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid value in batch"
+        )
+
+    for userid in changed:
+        await invalidate_user_async(
+            userid, usernames[userid], deleted=userid in deletes
         )
+    return results
@@ -1,27 +1,166 @@
+from config.settings import settings
 from fastapi import HTTPException, status
 from models.user import User
-from passlib.context import CryptContext
-from schemas.user import UserCreate, UserResponse, user_to_response
-from sqlalchemy import select
+from schemas.user import CachedUser, UserCreate, UserResponse
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from utils.cache import TTLCache
+from utils.invalidation_bus import (
+    USER_AUTH_CHANGED,
+    USER_DELETED,
+    USER_UPDATED,
+    invalidation_bus,
+)
+from utils.metrics import register_cache, registry
+from utils.password import check_password, hash_password
+from utils.process_pool import BoundedProcessPool, PoolBusyError
+from utils.tracing import span
 from utils.validators import validate_password, validate_user_credentials
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt 해시/검증 전용 프로세스 풀
+password_pool = BoundedProcessPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
 
+# bcrypt 프로세스 풀 메트릭
+registry.callback(
+    "password_hash_pending",
+    "bcrypt 프로세스 풀에서 실행 중이거나 대기 중인 작업 수",
+    lambda: {(): password_pool.pending},
+)
+registry.callback(
+    "password_hash_queued",
+    "bcrypt 프로세스 풀 대기열 길이",
+    lambda: {(): password_pool.stats()["queued"]},
+)
+registry.callback(
+    "password_hash_rejected_total",
+    "대기열이 가득 차서 거절된 bcrypt 작업 수",
+    lambda: {(): password_pool.rejected},
+    type="counter",
+)
 
-# 비밀번호 해시화
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
 
+# 사용자 조회 캐시 (username → 사용자)
+# - 조회 전용 경로(로그인, 중복 확인)에서만 사용하고, 사용자를 변경하는 함수에서 명시적으로 무효화
+user_cache_by_username: TTLCache[CachedUser] = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+# id → 캐시 항목 인덱스
+# - 조회에는 사용하지 않고, id만 전달되는 무효화(다른 워커의 변경 등)에서 username을 찾는 데 사용
+user_cache_by_id: TTLCache[CachedUser] = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+register_cache("user_by_username", user_cache_by_username)
 
-# 비밀번호 검증
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# 최근 변경된 사용자 (username → True)
+# - 복제 지연 동안 복제본에는 이전 비밀번호/권한이 남아 있으므로 이 기간에는 주 DB에서 인증
+recently_changed_users: TTLCache[bool] = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.DB_REPLICA_MAX_LAG_SECONDS
+)
+
+
+# 캐시에 저장하지 않는 필드
+def _cache_excluded_fields() -> set[str]:
+    return {
+        field.strip()
+        for field in settings.USER_CACHE_EXCLUDE_FIELDS.split(",")
+        if field.strip() in ("password", "created_at", "updated_at")
+    }
+
+
+# 사용자 캐시 저장 (설정된 제외 필드는 None으로 저장)
+def cache_user(user: CachedUser) -> None:
+    if not settings.USER_CACHE_ENABLED:
+        return
+
+    excluded = _cache_excluded_fields()
+    cached = user.model_copy(update={field: None for field in excluded})
+    user_cache_by_id.set(cached.id, cached)
+    user_cache_by_username.set(cached.username, cached)
+
+
+# 사용자 캐시 무효화
+def invalidate_user_cache(
+    user_id: str | None = None, username: str | None = None
+) -> None:
+    if user_id:
+        cached = user_cache_by_id.peek(user_id)
+        user_cache_by_id.delete(user_id)
+        if cached:
+            user_cache_by_username.delete(cached.username)
+    if username:
+        cached = user_cache_by_username.peek(username)
+        user_cache_by_username.delete(username)
+        if cached:
+            user_cache_by_id.delete(cached.id)
+
+
+# 사용자 캐시 무효화 + 다른 워커에 전파
+async def invalidate_user_async(
+    user_id: str, username: str | None = None, deleted: bool = False
+) -> None:
+    invalidate_user_cache(user_id=user_id, username=username)
+    await invalidation_bus.publish(USER_DELETED if deleted else USER_UPDATED, user_id)
+    if username:
+        mark_user_changed(username)
+        await invalidation_bus.publish(USER_AUTH_CHANGED, username)
+
+
+# 복제 지연 동안 주 DB에서 인증할 사용자로 표시
+def mark_user_changed(username: str) -> None:
+    recently_changed_users.set(username, True)
+
+
+# 사용자 캐시 전체 비우기
+def clear_user_cache() -> None:
+    user_cache_by_id.clear()
+    user_cache_by_username.clear()
+
+
+# 다른 워커에서 발생한 변경 반영
+invalidation_bus.subscribe(USER_UPDATED, lambda key: invalidate_user_cache(user_id=key))
+invalidation_bus.subscribe(USER_DELETED, lambda key: invalidate_user_cache(user_id=key))
+invalidation_bus.subscribe(USER_AUTH_CHANGED, mark_user_changed)
+invalidation_bus.on_flush(clear_user_cache)
+
+
+# 사용자 캐시 통계
+# - id 인덱스는 조회에 사용하지 않으므로(적중률이 항상 0) 포함하지 않음
+def user_cache_stats() -> dict[str, dict]:
+    return {"by_username": user_cache_by_username.stats()}
+
+
+# 비밀번호 해시화 (비동기식, 프로세스 풀에서 실행)
+async def get_password_hash_async(password: str) -> str:
+    try:
+        with span("bcrypt"):
+            return await password_pool.run(hash_password, password)
+    except PoolBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again later",
+        )
+
+
+# 비밀번호 검증 (비동기식, 프로세스 풀에서 실행)
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    try:
+        with span("bcrypt"):
+            return await password_pool.run(
+                check_password, plain_password, hashed_password
+            )
+    except PoolBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again later",
+        )
 
 
 # 사용자 생성 (비동기식)
 async def create_user_async(db: AsyncSession, user: UserCreate) -> User:
-    existing_user = await get_user_by_username_async(db, user.username)
+    existing_user = await get_cached_user_by_username_async(db, user.username)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists"
@@ -34,7 +173,7 @@ async def create_user_async(db: AsyncSession, user: UserCreate) -> User:
             status_code=status.HTTP_400_BAD_REQUEST, detail="; ".join(errors)
         )
 
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(username=user.username, password=hashed_password)
     db.add(db_user)
     await db.commit()
@@ -54,7 +193,7 @@ async def change_password_async(
         )
 
     # 현재 비밀번호 확인
-    if not verify_password(current_password, user.password):  # type: ignore
+    if not await verify_password_async(current_password, user.password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -67,9 +206,10 @@ async def change_password_async(
             status_code=status.HTTP_400_BAD_REQUEST, detail="; ".join(errors)
         )
 
-    user.password = get_password_hash(new_password)  # type: ignore
+    user.password = await get_password_hash_async(new_password)
     await db.commit()
     await db.refresh(user)
+    await invalidate_user_async(user.id, user.username)
 
     return user
 
@@ -88,23 +228,86 @@ async def get_user_by_id_async(db: AsyncSession, user_id: str) -> User | None:
     return result.scalar_one_or_none()
 
 
+# 사용자 조회(username) - 캐시 사용, 조회 전용
+# - 캐시에 없으면 DB에서 조회 후 캐시 저장
+# - need_password인데 password를 캐시하지 않는 설정이면 캐시를 조회하지 않음
+#   (쓸 수 없는 항목을 적중으로 세지 않도록)
+async def get_cached_user_by_username_async(
+    db: AsyncSession, username: str, need_password: bool = False
+) -> CachedUser | None:
+    if settings.USER_CACHE_ENABLED and not (
+        need_password and "password" in _cache_excluded_fields()
+    ):
+        cached = user_cache_by_username.get(username)
+        if cached is not None:
+            return cached
+
+    result = await db.execute(select(User).filter(User.username == username))
+    user = result.scalar_one_or_none()
+    if not user:
+        return None
+
+    snapshot = CachedUser.model_validate(user)
+    cache_user(snapshot)
+    return snapshot
+
+
 # 사용자 인증 (비동기식)
 async def authenticate_user_async(
     db: AsyncSession, username: str, password: str
 ) -> UserResponse | None:
-    user = await get_user_by_username_async(db, username)
-    if not user or not verify_password(password, user.password):  # type: ignore
+    user = await get_cached_user_by_username_async(db, username, need_password=True)
+    if (
+        not user
+        or not user.password
+        or not await verify_password_async(password, user.password)
+    ):
         return None
-    return user_to_response(user)
+    return UserResponse.model_validate(user.model_dump(exclude={"password"}))
+
+
+# 사용자 인증 - 읽기 복제본 사용 (로그인)
+# - 최근 변경된 사용자는 복제본에 이전 비밀번호/권한이 남아 있을 수 있으므로 주 DB에서 인증
+# - 복제본에서 사용자를 찾지 못했거나(가입 직후) 비밀번호가 맞지 않으면 주 DB에서 다시 조회하고,
+#   비밀번호 해시가 복제본과 다를 때만 다시 검증 (틀린 비밀번호에 bcrypt를 두 번 쓰지 않도록)
+async def authenticate_user_replica_async(
+    read_db: AsyncSession, db: AsyncSession, username: str, password: str
+) -> UserResponse | None:
+    if read_db.bind is db.bind or recently_changed_users.peek(username):
+        return await authenticate_user_async(db, username, password)
+
+    user = await get_cached_user_by_username_async(
+        read_db, username, need_password=True
+    )
+    if user and user.password and await verify_password_async(password, user.password):
+        return UserResponse.model_validate(user.model_dump(exclude={"password"}))
+
+    result = await db.execute(select(User).filter(User.username == username))
+    primary = result.scalar_one_or_none()
+    if not primary or (user and user.password == primary.password):
+        return None
+    snapshot = CachedUser.model_validate(primary)
+    cache_user(snapshot)
+    if not await verify_password_async(password, primary.password):
+        return None
+    return UserResponse.model_validate(snapshot.model_dump(exclude={"password"}))
 
 
 # 사용자 삭제 (비동기식)
+# - DELETE ... RETURNING 한 번으로 처리하고 리프레시 토큰은 ON DELETE CASCADE로 삭제
 async def delete_user_async(db: AsyncSession, user_id: str) -> UserResponse:
-    user = await get_user_by_id_async(db, user_id)
-    if not user:
+    result = await db.execute(
+        delete(User)
+        .where(User.id == user_id)
+        .returning(User.id, User.username, User.role, User.created_at, User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if not row:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="User not found"
         )
-    await db.delete(user)
     await db.commit()
-    return user_to_response(user)
+    await invalidate_user_async(row.id, row.username, deleted=True)
+    return UserResponse.model_validate(row)
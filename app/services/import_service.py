@@ -0,0 +1,218 @@
+import asyncio
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Literal
+from uuid import uuid4
+
+from config.settings import settings
+from fastapi import HTTPException, status
+from models.user import User
+from services.auth_service import password_pool
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils.logger import get_logger
+from utils.password import hash_passwords
+from utils.process_pool import PoolBusyError
+from utils.tracing import span
+from utils.validators import validate_user_credentials
+
+logger = get_logger("app.import")
+
+ImportFormat = Literal["csv", "ndjson"]
+
+DUPLICATE_USERNAME = "이미 존재하는 사용자명입니다."
+
+
+# 바이트 스트림을 줄 단위로 분리 (빈 줄 제외)
+async def _iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    buffer = b""
+    first = True
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            decoded = line.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+            first = False
+            if decoded.strip():
+                yield decoded
+    if buffer.strip():
+        yield buffer.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+
+
+# 요청 본문을 (행 번호, 사용자명, 비밀번호, 파싱 오류) 단위로 변환
+# - csv: 첫 줄은 username, password 컬럼을 포함한 헤더
+# - ndjson: 한 줄에 {"username": ..., "password": ...} 하나
+async def iter_import_rows(
+    stream: AsyncIterator[bytes], format: ImportFormat
+) -> AsyncIterator[tuple[int, str, str, str | None]]:
+    lines = _iter_lines(stream)
+    columns: dict[str, int] = {}
+    if format == "csv":
+        header = await anext(lines, None)
+        if header is None:
+            return
+        names = [name.strip().lower() for name in next(csv.reader([header]))]
+        if "username" not in names or "password" not in names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV header must contain username and password",
+            )
+        columns = {name: names.index(name) for name in ("username", "password")}
+
+    row = 0
+    async for line in lines:
+        row += 1
+        if format == "csv":
+            values = next(csv.reader([line]))
+            if len(values) <= max(columns.values()):
+                yield row, "", "", "컬럼 수가 부족합니다."
+                continue
+            yield row, values[columns["username"]], values[columns["password"]], None
+        else:
+            try:
+                data = json.loads(line)
+                yield row, str(data["username"]), str(data["password"]), None
+            except (ValueError, TypeError, KeyError):
+                yield row, "", "", "잘못된 JSON 행입니다."
+
+
+# 비밀번호 목록 해시화
+# - 작은 묶음으로 나눠 동시에 USER_IMPORT_HASH_CONCURRENCY개만 제출하므로
+#   로그인/회원가입 해시 작업이 일괄 등록 뒤에 오래 밀리지 않음
+# - 풀이 가득 차면 잠시 기다렸다가 다시 제출
+async def _hash_passwords(passwords: list[str]) -> list[str]:
+    size = settings.USER_IMPORT_HASH_BATCH_SIZE
+    semaphore = asyncio.Semaphore(settings.USER_IMPORT_HASH_CONCURRENCY)
+
+    async def run(batch: list[str]) -> list[str]:
+        async with semaphore:
+            while True:
+                try:
+                    return await password_pool.run(hash_passwords, batch)
+                except PoolBusyError:
+                    await asyncio.sleep(0.1)
+
+    batches = [passwords[i : i + size] for i in range(0, len(passwords), size)]
+    with span("bcrypt"):
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [hashed for batch in results for hashed in batch]
+
+
+# 청크 하나 저장
+# - 기존 사용자와의 중복은 청크당 쿼리 한 번으로 확인
+# - 해시가 끝난 뒤에 COPY 트랜잭션을 시작 (해시 중에는 커넥션을 풀에 반환)
+# - 임시 테이블에 COPY 한 뒤 INSERT ... ON CONFLICT로 옮겨서
+#   확인 이후 다른 요청이 같은 username을 등록한 경우도 중복으로 처리
+# - (등록된 행 수, 오류 목록) 반환
+async def _import_chunk(
+    db: AsyncSession, chunk: list[tuple[int, str, str]]
+) -> tuple[int, list[dict[str, Any]]]:
+    errors: list[dict[str, Any]] = []
+    result = await db.execute(
+        select(User.username).filter(User.username.in_([c[1] for c in chunk]))
+    )
+    existing = set(result.scalars().all())
+    if existing:
+        errors += [
+            {"row": row, "username": username, "errors": [DUPLICATE_USERNAME]}
+            for row, username, _ in chunk
+            if username in existing
+        ]
+        chunk = [c for c in chunk if c[1] not in existing]
+    # 해시하는 동안 커넥션을 idle in transaction 상태로 잡아두지 않도록 조회 트랜잭션 종료
+    await db.rollback()
+    if not chunk:
+        return 0, errors
+
+    hashed = await _hash_passwords([password for _, _, password in chunk])
+    records = [
+        (str(uuid4()), username, password)
+        for (_, username, _), password in zip(chunk, hashed)
+    ]
+
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE user_import (id varchar, username varchar, password varchar)"
+            " ON COMMIT DROP"
+        )
+    )
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        "user_import", records=records, columns=["id", "username", "password"]
+    )
+    result = await db.execute(
+        text(
+            "INSERT INTO users (id, username, password, role)"
+            " SELECT id, username, password, 'MEMBER' FROM user_import"
+            " ON CONFLICT (username) DO NOTHING RETURNING username"
+        )
+    )
+    inserted = set(result.scalars().all())
+    await db.commit()
+
+    errors += [
+        {"row": row, "username": username, "errors": [DUPLICATE_USERNAME]}
+        for row, username, _ in chunk
+        if username not in inserted
+    ]
+    return len(inserted), errors
+
+
+# 사용자 일괄 등록
+# - 본문을 스트리밍으로 읽으면서 USER_IMPORT_CHUNK_SIZE 행마다 검증/해시/저장
+# - 청크마다 커밋하므로 중간에 실패해도 이전 청크는 유지
+# - 행 번호(헤더 제외, 1부터)별 오류 보고서 반환
+async def import_users(
+    db: AsyncSession, stream: AsyncIterator[bytes], format: ImportFormat
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    total = 0
+    imported = 0
+    errors: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    chunk: list[tuple[int, str, str]] = []
+
+    async for row, username, password, parse_error in iter_import_rows(stream, format):
+        total += 1
+        username = username.strip()
+        if parse_error:
+            errors.append({"row": row, "username": username, "errors": [parse_error]})
+            continue
+
+        is_valid, row_errors = validate_user_credentials(username, password)
+        if username in seen:
+            row_errors.append("파일 안에서 중복된 사용자명입니다.")
+        if not is_valid or username in seen:
+            errors.append({"row": row, "username": username, "errors": row_errors})
+            continue
+
+        seen.add(username)
+        chunk.append((row, username, password))
+        if len(chunk) >= settings.USER_IMPORT_CHUNK_SIZE:
+            count, chunk_errors = await _import_chunk(db, chunk)
+            imported += count
+            errors += chunk_errors
+            chunk = []
+
+    if chunk:
+        count, chunk_errors = await _import_chunk(db, chunk)
+        imported += count
+        errors += chunk_errors
+
+    duration = time.perf_counter() - start
+    logger.info(
+        "사용자 일괄 등록 - 전체: %d건 등록: %d건 실패: %d건 처리시간: %.3f초",
+        total,
+        imported,
+        len(errors),
+        duration,
+    )
+    errors.sort(key=lambda e: e["row"])
+    return {
+        "total": total,
+        "imported": imported,
+        "failed": len(errors),
+        "errors": errors,
+    }
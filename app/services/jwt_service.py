@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import uuid4
@@ -6,15 +8,32 @@ from config.settings import settings
 from jose import ExpiredSignatureError, JWTError, jwt
 from models.enums import UserRole
 from models.refresh_token import RefreshToken
-from sqlalchemy import select
+from models.user import User
+from schemas.user import UserResponse
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from utils.cache import TTLCache
+from utils.invalidation_bus import TOKEN_REVOKED, invalidation_bus
+from utils.metrics import register_cache, token_refresh_total
+
+# 검증된 액세스 토큰 캐시 (토큰 digest → 사용자 정보)
+# - 토큰의 exp 시각에 맞춰 만료되므로 만료된 토큰이 캐시에서 통과되지 않음
+verified_token_cache: TTLCache[UserResponse] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE
+)
+register_cache("verified_token", verified_token_cache)
 
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# 토큰 문자열의 고정 길이 digest (SHA-256 hex)
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 # 액세스 토큰 생성
 def create_access_token(user_id: str, username: str, role: UserRole) -> str:
     to_encode = {
@@ -41,8 +60,9 @@ def verify_token(token: str) -> dict[str, Any] | None:
         return None
 
 
-# 리프레시 토큰 생성 (비동기식)
-async def create_refresh_token_async(user_id: str, db: AsyncSession):
+# 리프레시 토큰 생성 (DB 저장 전)
+# - 토큰 문자열과 아직 세션에 추가되지 않은 RefreshToken 행을 반환
+def build_refresh_token(user_id: str) -> tuple[str, RefreshToken]:
     exp = _utc_now() + timedelta(days=settings.JWT_REFRESH_EXPIRES_IN_DAYS)
     payload = {
         "sub": user_id,
@@ -54,7 +74,15 @@ async def create_refresh_token_async(user_id: str, db: AsyncSession):
         payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
 
-    db_token = RefreshToken(user_id=user_id, token=token, expires_at=exp)
+    db_token = RefreshToken(
+        user_id=user_id, token_hash=token_digest(token), expires_at=exp
+    )
+    return token, db_token
+
+
+# 리프레시 토큰 생성 (비동기식)
+async def create_refresh_token_async(user_id: str, db: AsyncSession):
+    token, db_token = build_refresh_token(user_id)
     db.add(db_token)
     await db.commit()
     return token
@@ -64,7 +92,7 @@ async def create_refresh_token_async(user_id: str, db: AsyncSession):
 async def get_refresh_token_async(db: AsyncSession, token: str) -> RefreshToken | None:
     stmt = (
         select(RefreshToken)
-        .filter(RefreshToken.token == token)
+        .filter(RefreshToken.token_hash == token_digest(token))
         .options(selectinload(RefreshToken.user))
     )
     result = await db.execute(stmt)
@@ -75,7 +103,10 @@ async def get_refresh_token_async(db: AsyncSession, token: str) -> RefreshToken
 async def revoke_refresh_token_async(
     db: AsyncSession, token: str
 ) -> RefreshToken | None:
-    stmt = select(RefreshToken).filter(RefreshToken.token == token)
+    if not token:
+        return None
+
+    stmt = select(RefreshToken).filter(RefreshToken.token_hash == token_digest(token))
     result = await db.execute(stmt)
     refresh_token = result.scalar_one_or_none()
 
@@ -84,6 +115,7 @@ async def revoke_refresh_token_async(
     refresh_token.revoked = True
     await db.commit()
     await db.refresh(refresh_token)
+    await invalidation_bus.publish(TOKEN_REVOKED, refresh_token.token_hash)
     return refresh_token
 
 
@@ -95,39 +127,69 @@ async def refresh_access_token_async(
     # Refresh token 검증
     payload = verify_token(refresh_token_str)
     if not payload or payload.get("type") != "refresh":
+        token_refresh_total.inc("rejected")
         return None
 
-    # 데이터베이스에서 refresh token 확인 (동시 접근 방지)
-    db_refresh_token = await get_refresh_token_async(db, refresh_token_str)
-
-    if not db_refresh_token or db_refresh_token.revoked:
-        return None
-
-    # 만료 확인
-    if db_refresh_token.expires_at < _utc_now():
-        return None
-
-    # 기존 refresh token revoke (원자적 처리)
-    db_refresh_token.revoked = True
-    await db.commit()
-    await db.refresh(db_refresh_token)
+    # 기존 refresh token revoke + 사용자 조회를 하나의 문장으로 처리
+    # - WHERE revoked = false 조건부 UPDATE이므로 동시에 같은 토큰으로 갱신해도
+    #   행 잠금에 의해 단 하나의 요청만 성공
+    rotated = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_digest(refresh_token_str),
+            RefreshToken.revoked.is_(False),
+            RefreshToken.expires_at > _utc_now(),
+        )
+        .values(revoked=True)
+        .returning(RefreshToken.user_id)
+        .cte("rotated")
+    )
+    stmt = select(User).join(rotated, User.id == rotated.c.user_id)
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
 
-    user = db_refresh_token.user
     if not user:
+        await db.rollback()
+        token_refresh_total.inc("rejected")
         return None
 
-    # 새로운 access token과 refresh token 생성
+    # 새로운 access token과 refresh token 생성 (같은 트랜잭션에서 커밋)
     new_access_token = create_access_token(user.id, user.username, user.role)
-    new_refresh_token = await create_refresh_token_async(user.id, db)
+    new_refresh_token, db_token = build_refresh_token(user.id)
+    db.add(db_token)
+    await db.commit()
+    token_refresh_total.inc("rotated")
 
     return new_access_token, new_refresh_token
 
 
-async def cleanup_expired_tokens_async(db: AsyncSession):
-    stmt = select(RefreshToken).filter(RefreshToken.expires_at < _utc_now())
-    result = await db.execute(stmt)
-    expired_tokens = result.scalars().all()
-
-    for token in expired_tokens:
-        await db.delete(token)
-    await db.commit()
+# 만료/취소된 리프레시 토큰 정리 (비동기식)
+# - 한 번에 batch_size개씩 set-based DELETE 후 커밋하여 트랜잭션과 메모리를 제한
+# - 배치 사이에 pause초 동안 대기하여 다른 쿼리에 양보
+# - 삭제된 행 수 반환
+async def cleanup_expired_tokens_async(
+    db: AsyncSession, batch_size: int = 1000, pause: float = 0.0
+) -> int:
+    total = 0
+    while True:
+        batch = (
+            select(RefreshToken.id)
+            .where(
+                or_(
+                    RefreshToken.expires_at < _utc_now(),
+                    RefreshToken.revoked.is_(True),
+                )
+            )
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch.scalar_subquery()))
+        )
+        await db.commit()
+
+        deleted = result.rowcount or 0
+        total += deleted
+        if deleted < batch_size:
+            return total
+        if pause:
+            await asyncio.sleep(pause)
@@ -0,0 +1,312 @@
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from config.db import async_engine
+from config.settings import settings
+from models.refresh_token import RefreshToken
+from services import jwt_service
+from sqlalchemy import (
+    Index,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from utils.logger import get_logger
+from utils.partitioning import (
+    PartitionInterval,
+    create_default_partition_sql,
+    create_partition_sql,
+    default_partition_name,
+    detect_interval,
+    is_partitioned_sql,
+    list_partitions_sql,
+    parse_partition_name,
+    partition_step,
+    planned_partitions,
+)
+
+logger = get_logger("app.maintenance")
+
+# 토큰 정리 작업용 advisory lock 키 (여러 워커 중 하나만 실행)
+TOKEN_PURGE_LOCK_KEY = 0x72656672657368  # "refresh"
+
+# 마지막 토큰 정리 결과
+token_purge_stats: dict[str, Any] = {
+    "runs": 0,
+    "skipped": 0,
+    "last_purged": None,
+    "last_duration": None,
+    "last_run_at": None,
+    "total_purged": 0,
+    "partitions_created": 0,
+    "partitions_dropped": 0,
+}
+
+
+# 리프레시 토큰 파티션 관리 (refresh_tokens가 파티션 테이블인 경우)
+# - 구간 단위(day, week)는 기존 파티션 이름에서 읽음
+# - 지금부터 새로 발급될 토큰의 만료 시각 + TOKEN_PARTITION_PREMAKE 구간까지 파티션을 미리 생성
+# - 상한이 현재 시각 이전인 파티션은 모든 행이 만료되었으므로 DROP (행 단위 DELETE 없음)
+# - 기본 파티션은 DROP 할 수 없으므로 만료된 행만 DELETE
+# - (생성한 파티션 수, 삭제한 파티션 수, 기본 파티션에서 삭제한 행 수) 반환
+async def maintain_token_partitions(
+    conn: AsyncConnection, table: str = "refresh_tokens"
+) -> tuple[int, int, int]:
+    result = await conn.execute(text(list_partitions_sql(table)))
+    existing = set(result.scalars().all())
+    await conn.commit()
+    default = default_partition_name(table)
+    now = datetime.now(timezone.utc)
+
+    created = 0
+    interval = detect_interval(table, existing)
+    if interval is None:
+        logger.warning(
+            "구간 단위를 알 수 있는 파티션이 없어 파티션을 만들지 않음 - %s", table
+        )
+    else:
+        end = now + timedelta(days=settings.JWT_REFRESH_EXPIRES_IN_DAYS)
+        end += partition_step(interval) * settings.TOKEN_PARTITION_PREMAKE
+        for name, start, stop in planned_partitions(table, interval, now, end):
+            if name in existing:
+                continue
+            try:
+                await _create_partition(
+                    conn, table, name, start, stop, default in existing
+                )
+                await conn.commit()
+                created += 1
+            except DBAPIError:
+                # 다른 단위의 파티션과 범위가 겹치는 경우 등
+                await conn.rollback()
+                logger.warning("파티션 생성 실패 - %s", name, exc_info=True)
+
+    dropped = 0
+    for name in sorted(existing):
+        bounds = parse_partition_name(table, name)
+        if bounds and bounds[1] <= now.date():
+            await conn.execute(text(f"DROP TABLE {name}"))
+            await conn.commit()
+            dropped += 1
+
+    purged = 0
+    if default in existing:
+        result = await conn.execute(
+            text(f"DELETE FROM {default} WHERE expires_at < :now"), {"now": now}
+        )
+        await conn.commit()
+        purged = result.rowcount
+
+    return created, dropped, purged
+
+
+# 파티션 생성
+# - 기본 파티션에 같은 범위의 행이 있으면 파티션을 만들 수 없으므로, 같은 트랜잭션에서
+#   해당 행을 임시 테이블로 옮기고 파티션을 만든 뒤 다시 넣어 새 파티션으로 이동
+async def _create_partition(
+    conn: AsyncConnection,
+    table: str,
+    name: str,
+    start: date,
+    stop: date,
+    has_default: bool,
+) -> None:
+    if has_default:
+        await conn.execute(text(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE"))
+        await conn.execute(
+            text(f"CREATE TEMP TABLE partition_moved (LIKE {table}) ON COMMIT DROP")
+        )
+        await conn.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default_partition_name(table)} "
+                "WHERE expires_at >= :start AND expires_at < :stop RETURNING *) "
+                "INSERT INTO partition_moved SELECT * FROM moved"
+            ),
+            {
+                "start": datetime.combine(start, datetime.min.time(), timezone.utc),
+                "stop": datetime.combine(stop, datetime.min.time(), timezone.utc),
+            },
+        )
+    await conn.execute(text(create_partition_sql(table, name, start, stop)))
+    if has_default:
+        await conn.execute(text(f"INSERT INTO {table} SELECT * FROM partition_moved"))
+
+
+# refresh_tokens를 expires_at 기준 파티션 테이블로 변환 (partition-tokens 명령)
+# - 아직 만료되지 않은 행만 옮기고, 지금부터 발급될 토큰의 만료 시각까지 덮는 파티션과
+#   기본 파티션 생성
+# - 이미 파티션 테이블이면 None, 아니면 옮긴 행 수 반환
+async def partition_token_table(interval: PartitionInterval) -> int | None:
+    return await _rebuild_token_table(interval)
+
+
+# 파티션 테이블을 일반 테이블로 되돌리기 (unpartition-tokens 명령)
+# - 이미 일반 테이블이면 None, 아니면 옮긴 행 수 반환
+async def unpartition_token_table() -> int | None:
+    return await _rebuild_token_table(None)
+
+
+# refresh_tokens 테이블 정의
+# - 파티션 테이블이면 기본 키와 token_hash unique 인덱스에 파티션 키(expires_at) 추가
+#   (token_hash 단독 unique는 DB에서 보장하지 않음)
+def _token_table(partitioned: bool) -> Table:
+    table = RefreshToken.__table__
+    if not partitioned:
+        return table
+
+    metadata = MetaData()
+    table.metadata.tables["users"].to_metadata(metadata)  # 외래 키 대상
+    copy = table.to_metadata(metadata)
+    copy.dialect_options["postgresql"]["partition_by"] = "RANGE (expires_at)"
+    copy.c.expires_at.primary_key = True
+    copy.append_constraint(
+        PrimaryKeyConstraint("id", "expires_at", name="refresh_tokens_pkey")
+    )
+    for index in list(copy.indexes):
+        if index.name == "ix_refresh_tokens_token_hash":
+            copy.indexes.discard(index)
+    Index(
+        "ix_refresh_tokens_token_hash",
+        copy.c.token_hash,
+        copy.c.expires_at,
+        unique=True,
+    )
+    return copy
+
+
+# refresh_tokens 테이블을 다시 만들고 행을 옮김 (한 트랜잭션)
+# - 토큰 정리 작업과 같은 advisory lock을 잡고, 변환 중에는 테이블 전체를 잠금
+async def _rebuild_token_table(interval: PartitionInterval | None) -> int | None:
+    table = _token_table(interval is not None)
+    columns = ", ".join(column.name for column in table.columns)
+    async with async_engine.begin() as conn:
+        await conn.execute(select(func.pg_advisory_xact_lock(TOKEN_PURGE_LOCK_KEY)))
+        partitioned = await conn.scalar(text(is_partitioned_sql(table.name)))
+        if partitioned == (interval is not None):
+            return None
+
+        await conn.execute(text(f"LOCK TABLE {table.name} IN ACCESS EXCLUSIVE MODE"))
+        condition = "expires_at > now()" if interval else "true"
+        await conn.execute(
+            text(
+                f"CREATE TEMP TABLE {table.name}_stash ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table.name} WHERE {condition}"
+            )
+        )
+        await conn.execute(text(f"DROP TABLE {table.name}"))
+        await conn.run_sync(table.create)
+
+        if interval:
+            now = datetime.now(timezone.utc)
+            end = now + timedelta(days=settings.JWT_REFRESH_EXPIRES_IN_DAYS)
+            end += partition_step(interval) * settings.TOKEN_PARTITION_PREMAKE
+            for name, start, stop in planned_partitions(table.name, interval, now, end):
+                await conn.execute(
+                    text(create_partition_sql(table.name, name, start, stop))
+                )
+            await conn.execute(text(create_default_partition_sql(table.name)))
+
+        result = await conn.execute(
+            text(
+                f"INSERT INTO {table.name} ({columns}) "
+                f"SELECT {columns} FROM {table.name}_stash"
+            )
+        )
+        return result.rowcount
+
+
+# 토큰 정리 1회 실행
+# - 다른 워커가 이미 실행 중이면(advisory lock 획득 실패) None 반환
+# - 파티션 테이블이면 파티션 생성/삭제, 아니면 만료/취소 행을 배치 DELETE
+# - 성공 시 삭제된 행 수 반환 (파티션 모드에서는 기본 파티션에서 삭제한 행 수)
+async def purge_tokens_once() -> int | None:
+    async with async_engine.connect() as conn:
+        locked = await conn.scalar(
+            select(func.pg_try_advisory_lock(TOKEN_PURGE_LOCK_KEY))
+        )
+        await conn.commit()
+        if not locked:
+            token_purge_stats["skipped"] += 1
+            return None
+
+        start = time.perf_counter()
+        try:
+            partitioned = await conn.scalar(text(is_partitioned_sql("refresh_tokens")))
+            await conn.commit()
+            if partitioned:
+                created, dropped, purged = await maintain_token_partitions(conn)
+                token_purge_stats["partitions_created"] += created
+                token_purge_stats["partitions_dropped"] += dropped
+            else:
+                async with AsyncSession(bind=conn) as db:
+                    purged = await jwt_service.cleanup_expired_tokens_async(
+                        db,
+                        batch_size=settings.TOKEN_PURGE_BATCH_SIZE,
+                        pause=settings.TOKEN_PURGE_BATCH_PAUSE_SECONDS,
+                    )
+        finally:
+            # 실패한 트랜잭션에서는 unlock 쿼리도 실패하므로 먼저 롤백
+            # (세션 수준 lock은 롤백으로 풀리지 않음)
+            await conn.rollback()
+            await conn.execute(select(func.pg_advisory_unlock(TOKEN_PURGE_LOCK_KEY)))
+            await conn.commit()
+
+    duration = time.perf_counter() - start
+    token_purge_stats["runs"] += 1
+    token_purge_stats["last_purged"] = purged
+    token_purge_stats["last_duration"] = duration
+    token_purge_stats["last_run_at"] = time.time()
+    token_purge_stats["total_purged"] += purged
+    logger.info("토큰 정리 완료 - 삭제: %d건 처리시간: %.3f초", purged, duration)
+    return purged
+
+
+# 토큰 정리 스케줄러 (lifespan에서 백그라운드 태스크로 실행)
+async def run_token_purge_loop() -> None:
+    while True:
+        try:
+            await purge_tokens_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("토큰 정리 실패")
+        await asyncio.sleep(settings.TOKEN_PURGE_INTERVAL_SECONDS)
+
+
+# 파티션 변환 명령 (변환 중 테이블을 잠그므로 트래픽이 적은 시간에 직접 실행)
+# - python -m services.maintenance_service partition-tokens {day,week}
+# - python -m services.maintenance_service unpartition-tokens
+async def _main(args: argparse.Namespace) -> None:
+    try:
+        if args.command == "partition-tokens":
+            moved = await partition_token_table(args.interval)
+        else:
+            moved = await unpartition_token_table()
+    finally:
+        await async_engine.dispose()
+
+    if moved is None:
+        print("이미 변환된 테이블입니다")
+    else:
+        print(f"refresh_tokens 변환 완료 - 옮긴 행: {moved}건")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m services.maintenance_service")
+    commands = parser.add_subparsers(dest="command", required=True)
+    partition = commands.add_parser(
+        "partition-tokens", help="refresh_tokens를 expires_at 기준 파티션 테이블로 변환"
+    )
+    partition.add_argument("interval", choices=["day", "week"], help="파티션 구간 단위")
+    commands.add_parser(
+        "unpartition-tokens", help="파티션 테이블을 일반 테이블로 되돌리기"
+    )
+    asyncio.run(_main(parser.parse_args()))
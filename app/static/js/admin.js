@@ -1,97 +1,212 @@
 'use strict';
 
-async function fetchAndRenderUsers() {
+const PAGE_SIZE = 50;
+
+// 현재 검색 조건과 다음 페이지 커서
+const userListState = {
+    username: '',
+    role: '',
+    nextCursor: null,
+};
+
+// 사용자 한 명을 목록 항목으로 렌더링
+function renderUserItem(li, u) {
+    const nameColor = u.role === 'admin' ? 'red' : (u.role === 'manager' ? 'yellow' : 'white');
+
+    li.dataset.user = JSON.stringify(u);
+    li.innerHTML = `
+        <input type="checkbox" class="select-user" data-id="${u.id}">
+        <button class="modify-button" data-id="${u.id}">modify</button>
+        <button class="delete-button" data-id="${u.id}">delete</button>
+        ${u.id} ${u.username}
+        <span style=\"color: ${nameColor};\">${u.role}</span>
+    `;
+}
+
+// 사용자 목록 한 페이지 조회 (reset이면 처음부터 다시 조회)
+async function fetchAndRenderUsers(reset = true) {
+    const userList = document.getElementById('user-list');
+    const loadMoreButton = document.getElementById('loadMoreButton');
+
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (userListState.username) params.set('username', userListState.username);
+    if (userListState.role) params.set('role', userListState.role);
+    if (!reset && userListState.nextCursor) params.set('cursor', userListState.nextCursor);
+
     try {
-        const response = await fetch('/admin/user');
+        const response = await fetch(`/admin/user?${params}`);
         if (!response.ok) throw new Error('관리자 정보를 불러오지 못했습니다.');
         const data = await response.json();
-        // 사용자 목록 렌더링
-        const userList = document.getElementById('user-list');
-        userList.innerHTML = '';
+
+        if (reset) userList.innerHTML = '';
         data.users.forEach(u => {
             const li = document.createElement('li');
-
-            const nameColor = u.role === 'admin' ? 'red' : (u.role === 'manager' ? 'yellow' : 'white');
-
-            li.innerHTML = `
-                <button class="modify-button" id="${u.id}">modify</button>
-                <button class="delete-button" id="${u.id}">delete</button>
-                ${u.id} ${u.username}
-                <span style=\"color: ${nameColor};\">${u.role}</span>
-            `;
+            renderUserItem(li, u);
             userList.appendChild(li);
         });
-        addEventListenersToButtons();
+
+        userListState.nextCursor = data.next_cursor;
+        loadMoreButton.style.display = data.next_cursor ? '' : 'none';
     } catch (e) {
         alert('관리자/사용자 정보를 불러오지 못했습니다.');
     }
 }
 
-window.addEventListener('DOMContentLoaded', fetchAndRenderUsers);
-
-function addEventListenersToButtons() {
-    const modifyButtons = document.querySelectorAll('.modify-button');
-    const deleteButtons = document.querySelectorAll('.delete-button');
-    const userModifyForm = document.querySelector('#userModifyForm');
-    modifyButtons.forEach(button => {
-        button.addEventListener('click', async (event) => {
-            const id = button.getAttribute('id');
-            const formData = new FormData(userModifyForm);
-            const attribute = formData.get('attribute').trim();
-            const value = formData.get('value').trim();
-            const type = formData.get('type');
-            if (!type) {
-                alert('수정할 타입을 선택해주세요.');
-                return;
-            }
-            if (!attribute || !value) {
-                alert('수정할 속성과 값을 입력해주세요.');
-                return;
-            }
-            try {
-                const response = await fetch(`/admin/user`, {
-                    method: 'PUT',
-                    headers: {
-                        "Content-Type": "application/json"
-                    },
-                    body: JSON.stringify({
-                        "userid": id,
-                        "attr": attribute,
-                        "attr_type": type,
-                        "value": value
-                    })
-
-                });
-                if (response.ok) {
-                    fetchAndRenderUsers();
-                } else {
-                    alert('수정 요청에 실패했습니다.');
-                }
-            } catch (error) {
-                console.error('수정 요청 중 오류 발생:', error);
-                alert('수정 요청 중 오류가 발생했습니다. 나중에 다시 시도해주세요.');
+window.addEventListener('DOMContentLoaded', () => {
+    fetchAndRenderUsers();
+
+    document.getElementById('userSearchForm').addEventListener('submit', (event) => {
+        event.preventDefault();
+        const formData = new FormData(event.target);
+        userListState.username = formData.get('username').trim();
+        userListState.role = formData.get('role');
+        userListState.nextCursor = null;
+        fetchAndRenderUsers();
+    });
+
+    document.getElementById('loadMoreButton').addEventListener('click', () => {
+        fetchAndRenderUsers(false);
+    });
+
+    document.getElementById('user-list').addEventListener('click', (event) => {
+        const li = event.target.closest('li');
+        if (event.target.classList.contains('modify-button')) {
+            modifyUser(li, event.target.dataset.id);
+        } else if (event.target.classList.contains('delete-button')) {
+            deleteUser(li, event.target.dataset.id);
+        }
+    });
+
+    document.getElementById('modifySelectedButton').addEventListener('click', () => {
+        const form = readModifyForm();
+        if (!form) return;
+        submitBatch(selectedUserIds().map(id => ({
+            op: 'modify',
+            userid: id,
+            attr: form.attribute,
+            attr_type: form.type,
+            value: form.value,
+        })));
+    });
+
+    document.getElementById('deleteSelectedButton').addEventListener('click', () => {
+        const ids = selectedUserIds();
+        if (ids.length && !confirm(`선택한 ${ids.length}명을 삭제하시겠습니까?`)) return;
+        submitBatch(ids.map(id => ({ op: 'delete', userid: id })));
+    });
+});
+
+// 체크된 사용자 id 목록
+function selectedUserIds() {
+    return Array.from(document.querySelectorAll('#user-list .select-user:checked'))
+        .map(checkbox => checkbox.dataset.id);
+}
+
+// 수정 폼 값 읽기 (입력이 부족하면 알림 후 null)
+function readModifyForm() {
+    const formData = new FormData(document.querySelector('#userModifyForm'));
+    const attribute = formData.get('attribute').trim();
+    const value = formData.get('value').trim();
+    const type = formData.get('type');
+    if (!type) {
+        alert('수정할 타입을 선택해주세요.');
+        return null;
+    }
+    if (!attribute || !value) {
+        alert('수정할 속성과 값을 입력해주세요.');
+        return null;
+    }
+    return { attribute, value, type };
+}
+
+// 선택한 사용자 일괄 수정/삭제 (성공한 항목만 목록에 반영)
+async function submitBatch(operations) {
+    if (!operations.length) {
+        alert('사용자를 선택해주세요.');
+        return;
+    }
+    try {
+        const response = await fetch('/admin/user/batch', {
+            method: 'POST',
+            headers: {
+                "Content-Type": "application/json"
+            },
+            body: JSON.stringify({ operations })
+        });
+        if (!response.ok) {
+            alert('일괄 처리 요청에 실패했습니다.');
+            return;
+        }
+        const data = await response.json();
+        data.results.forEach(r => {
+            const checkbox = document.querySelector(`#user-list .select-user[data-id="${r.userid}"]`);
+            if (!checkbox || r.status !== 'success') return;
+            const li = checkbox.closest('li');
+            if (r.op === 'delete') {
+                li.remove();
                 return;
             }
+            const op = operations[r.index];
+            const user = JSON.parse(li.dataset.user);
+            user[op.attr] = op.attr === 'role' ? op.value.toLowerCase() : op.value;
+            renderUserItem(li, user);
         });
-    });
-    deleteButtons.forEach(button => {
-        button.addEventListener('click', async (event) => {
-            const id = button.getAttribute('id');
-            if (confirm('정말로 삭제하시겠습니까?')) {
-                try {
-                    const response = await fetch(`/admin/user?userid=${id}`, {
-                        method: 'DELETE'
-                    });
-                    if (response.ok) {
-                        fetchAndRenderUsers();
-                    } else {
-                        alert('삭제 요청에 실패했습니다. 나중에 다시 시도해주세요.');
-                    }
-                } catch (error) {
-                    console.error('삭제 요청 중 오류 발생:', error);
-                    alert('삭제 요청 중 오류가 발생했습니다. 나중에 다시 시도해주세요.');
-                }
-            }
+        const failed = data.results.filter(r => r.status !== 'success');
+        if (failed.length) {
+            alert(`${failed.length}건을 처리하지 못했습니다.`);
+        }
+    } catch (error) {
+        console.error('일괄 처리 요청 중 오류 발생:', error);
+        alert('일괄 처리 요청 중 오류가 발생했습니다. 나중에 다시 시도해주세요.');
+    }
+}
+
+// 사용자 수정 (성공 시 해당 항목만 다시 렌더링)
+async function modifyUser(li, id) {
+    const form = readModifyForm();
+    if (!form) return;
+    const { attribute, value, type } = form;
+    try {
+        const response = await fetch(`/admin/user`, {
+            method: 'PUT',
+            headers: {
+                "Content-Type": "application/json"
+            },
+            body: JSON.stringify({
+                "userid": id,
+                "attr": attribute,
+                "attr_type": type,
+                "value": value
+            })
+
         });
-    });
-}
\ No newline at end of file
+        if (response.ok) {
+            const user = JSON.parse(li.dataset.user);
+            user[attribute] = attribute === 'role' ? value.toLowerCase() : value;
+            renderUserItem(li, user);
+        } else {
+            alert('수정 요청에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('수정 요청 중 오류 발생:', error);
+        alert('수정 요청 중 오류가 발생했습니다. 나중에 다시 시도해주세요.');
+    }
+}
+
+// 사용자 삭제 (성공 시 해당 항목만 제거)
+async function deleteUser(li, id) {
+    if (!confirm('정말로 삭제하시겠습니까?')) return;
+    try {
+        const response = await fetch(`/admin/user?userid=${id}`, {
+            method: 'DELETE'
+        });
+        if (response.ok) {
+            li.remove();
+        } else {
+            alert('삭제 요청에 실패했습니다. 나중에 다시 시도해주세요.');
+        }
+    } catch (error) {
+        console.error('삭제 요청 중 오류 발생:', error);
+        alert('삭제 요청 중 오류가 발생했습니다. 나중에 다시 시도해주세요.');
+    }
+}
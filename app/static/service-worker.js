@@ -1,14 +1,87 @@
-const VERSION = 'pwa-initial';
+// 서버(/service-worker.js)가 스크립트 앞에 배포 버전과 사전 캐시 목록을 채워서 제공
+// self.__SW_MANIFEST = { version: '...', precache: ['/', '/static/css/base.<hash>.css', ...], pages: ['/', ...] }
+const { version: VERSION, precache: PRECACHE_URLS, pages: SHELL_PAGES } = self.__SW_MANIFEST;
 
+const PRECACHE = `precache-${VERSION}`;
+const RUNTIME = `runtime-${VERSION}`;
+
+// 설치: 앱 셸(페이지, CSS, JS, 이미지) 사전 캐시
 self.addEventListener('install', (event) => {
-    self.skipWaiting();
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then((cache) => cache.addAll(PRECACHE_URLS.map((url) => new Request(url, { cache: 'no-cache' }))))
+            .then(() => self.skipWaiting())
+    );
 });
 
+// 활성화: 이전 버전 캐시 삭제, 내비게이션 미리 로드 사용
 self.addEventListener('activate', (event) => {
-    event.waitUntil(self.clients.claim());
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(
+            names
+                .filter((name) => name !== PRECACHE && name !== RUNTIME)
+                .map((name) => caches.delete(name))
+        );
+        if (self.registration.navigationPreload) {
+            await self.registration.navigationPreload.enable();
+        }
+        await self.clients.claim();
+    })());
 });
 
-self.addEventListener('fetch', () => {
-    // 캐시 기능 없이 네트워크 요청만 통과
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(event, url));
+    } else if (url.pathname.startsWith('/static/')) {
+        event.respondWith(staleWhileRevalidate(event));
+    }
+    // API 등 나머지 요청은 respondWith 없이 브라우저가 직접 처리
 });
 
+// HTML: 네트워크 우선, 실패하면 캐시된 페이지 (없으면 메인 페이지)
+// - 사전 캐시한 앱 셸 페이지만 캐시를 갱신 (사용자별 페이지는 저장하지 않음)
+async function networkFirst(event, url) {
+    try {
+        const response = (await event.preloadResponse) || (await fetch(event.request));
+        if (response.ok && !response.redirected && SHELL_PAGES.includes(url.pathname)) {
+            const cache = await caches.open(PRECACHE);
+            event.waitUntil(cache.put(url.pathname, response.clone()));
+        }
+        return response;
+    } catch (error) {
+        const cached = await caches.match(url.pathname) || await caches.match('/');
+        if (cached) {
+            return cached;
+        }
+        throw error;
+    }
+}
+
+// 정적 파일: 캐시가 있으면 바로 응답하고 백그라운드에서 갱신
+async function staleWhileRevalidate(event) {
+    const cached = await caches.match(event.request);
+    const update = fetch(event.request).then(async (response) => {
+        if (response.ok) {
+            const cache = await caches.open(RUNTIME);
+            await cache.put(event.request, response.clone());
+        }
+        return response;
+    });
+
+    if (cached) {
+        event.waitUntil(update.catch(() => undefined));
+        return cached;
+    }
+    return update;
+}
@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+# 만료 시간 + 최대 크기(LRU) 기반 인메모리 캐시
+# - 항목마다 만료 시각(epoch 초)을 가지며, 만료된 항목은 조회 시 제거
+# - 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+# - 이벤트 루프 단일 스레드에서 사용하는 것을 전제로 하므로 락을 사용하지 않음
+class TTLCache(Generic[V]):
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.time()
+
+    # 캐시 조회 (없거나 만료되었으면 None)
+    def get(self, key: Hashable) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    # 통계, LRU 순서에 영향을 주지 않는 조회 (만료 여부는 확인)
+    def peek(self, key: Hashable) -> V | None:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    # 캐시 저장
+    # - expires_at: 항목의 만료 시각(epoch 초), 없으면 ttl 기준으로 계산
+    def set(self, key: Hashable, value: V, expires_at: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+
+        if expires_at is None:
+            expires_at = time.time() + self.ttl if self.ttl else float("inf")
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    # 캐시 항목 제거
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    # 캐시 전체 비우기
+    def clear(self) -> None:
+        self._data.clear()
+
+    # 캐시 통계 반환
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
@@ -1,9 +1,29 @@
-from config.db import get_async_db
+import asyncio
+import ipaddress
+
+from config.db import LazyAsyncSession, get_lazy_async_db
+from config.settings import settings
 from fastapi import Depends, HTTPException, Request, status
 from models.enums import UserRole
 from schemas.user import UserResponse
 from services import jwt_service
-from sqlalchemy.ext.asyncio import AsyncSession
+from utils.cache import TTLCache
+from utils.invalidation_bus import TOKEN_REVOKED, invalidation_bus
+from utils.tracing import span
+
+# 진행 중인 토큰 갱신 (refresh token digest → 갱신 결과 Future)
+# - 같은 refresh token으로 동시에 들어온 요청은 하나의 갱신 결과를 공유
+_inflight_refreshes: dict[str, asyncio.Future[tuple[str, str] | None]] = {}
+
+# 최근에 회전된 refresh token → 새 토큰 쌍 (grace window)
+# - 회전 직후 이전 토큰으로 도착한 요청도 같은 새 토큰 쌍을 받도록 함
+_rotated_tokens: TTLCache[tuple[str, str]] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_REFRESH_GRACE_SECONDS
+)
+# 새 refresh token digest → 이전 refresh token digest (로그아웃 시 grace 항목 제거용)
+_rotated_from: TTLCache[str] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_REFRESH_GRACE_SECONDS
+)
 
 
 # 액세스 토큰 쿠키에서 추출
@@ -17,7 +37,20 @@ def get_refresh_token(request: Request) -> str | None:
 
 
 # 토큰 검증 및 사용자 정보 반환
+# - 이미 검증된 토큰은 캐시에서 바로 반환 (서명 검증, 스키마 생성 생략)
 def decode_token(token: str) -> UserResponse:
+    with span("jwt"):
+        return _decode_token(token)
+
+
+def _decode_token(token: str) -> UserResponse:
+    cache_key = None
+    if settings.TOKEN_CACHE_ENABLED:
+        cache_key = jwt_service.token_digest(token)
+        cached_user = jwt_service.verified_token_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+
     payload = jwt_service.verify_token(token)
     if not payload:
         raise HTTPException(
@@ -27,18 +60,80 @@ def decode_token(token: str) -> UserResponse:
     # JWT 토큰의 'sub' 필드를 'id'로 변환
     payload["id"] = payload["sub"]
 
-    return UserResponse(**payload)
+    user = UserResponse(**payload)
+    if cache_key is not None:
+        jwt_service.verified_token_cache.set(
+            cache_key, user, expires_at=payload.get("exp")
+        )
+    return user
+
+
+# 같은 refresh token에 대한 갱신을 워커 내에서 한 번만 실행 (비동기식)
+async def _refresh_single_flight(
+    db: LazyAsyncSession, refresh_token: str
+) -> tuple[str, str] | None:
+    key = jwt_service.token_digest(refresh_token)
+
+    # 방금 회전된 토큰이면 후속 토큰 쌍 반환
+    rotated = _rotated_tokens.get(key)
+    if rotated is not None:
+        return rotated
+
+    # 이미 갱신 중이면 그 결과를 기다림
+    inflight = _inflight_refreshes.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[tuple[str, str] | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight_refreshes[key] = future
+    result = None
+    try:
+        result = await jwt_service.refresh_access_token_async(db.get(), refresh_token)
+        if result:
+            _rotated_tokens.set(key, result)
+            _rotated_from.set(jwt_service.token_digest(result[1]), key)
+        return result
+    finally:
+        # 실패하거나 취소된 경우 대기 중인 요청은 None(갱신 실패)을 받음
+        future.set_result(result)
+        _inflight_refreshes.pop(key, None)
+
+
+# 로그아웃 등으로 취소된 refresh token의 grace window 항목 제거
+def forget_rotated_refresh_token(refresh_token: str | None) -> None:
+    if refresh_token:
+        _forget_rotated_digest(jwt_service.token_digest(refresh_token))
+
+
+def _forget_rotated_digest(key: str) -> None:
+    previous = _rotated_from.peek(key)
+    if previous is not None:
+        _rotated_tokens.delete(previous)
+        _rotated_from.delete(key)
+
+
+# grace window 항목 전체 제거
+def _clear_rotated_tokens() -> None:
+    _rotated_tokens.clear()
+    _rotated_from.clear()
+
+
+# 다른 워커에서 취소된 refresh token 반영
+invalidation_bus.subscribe(TOKEN_REVOKED, _forget_rotated_digest)
+invalidation_bus.on_flush(_clear_rotated_tokens)
 
 
 # 토큰 갱신을 처리하는 내부 함수 (비동기식)
 async def _handle_token_refresh_async(
-    request: Request, db: AsyncSession, refresh_token: str
+    request: Request, db: LazyAsyncSession, refresh_token: str
 ) -> UserResponse | None:
     """토큰 갱신을 처리하는 내부 함수 (비동기)"""
     if not refresh_token:
         return None
 
-    result = await jwt_service.refresh_access_token_async(db, refresh_token)
+    result = await _refresh_single_flight(db, refresh_token)
     if result:
         new_access_token, new_refresh_token = result
         # request.state에 새로운 토큰들을 저장
@@ -54,7 +149,7 @@ async def _handle_token_refresh_async(
 # 현재 사용자 정보 조회(선택적) - 비동기식
 async def get_current_user_optional_async(
     request: Request,
-    db: AsyncSession = Depends(get_async_db),
+    db: LazyAsyncSession = Depends(get_lazy_async_db),
     access_token: str = Depends(get_access_token),
     refresh_token: str = Depends(get_refresh_token),
 ) -> UserResponse | None:
@@ -76,7 +171,7 @@ async def get_current_user_optional_async(
 # 현재 사용자 정보 조회(필수) - 비동기식
 async def get_current_user_async(
     request: Request,
-    db: AsyncSession = Depends(get_async_db),
+    db: LazyAsyncSession = Depends(get_lazy_async_db),
     access_token: str = Depends(get_access_token),
     refresh_token: str = Depends(get_refresh_token),
 ) -> UserResponse:
@@ -124,3 +219,34 @@ async def require_admin_async(
             status_code=status.HTTP_403_FORBIDDEN, detail="You are not admin"
         )
     return user
+
+
+# /metrics 접근 허용 네트워크
+_metrics_networks = [
+    ipaddress.ip_network(network.strip())
+    for network in settings.METRICS_ALLOWED_NETWORKS.split(",")
+    if network.strip()
+]
+
+
+def _is_metrics_network(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _metrics_networks)
+
+
+# /metrics 접근 권한 확인
+# - 허용된 네트워크에서 온 요청은 로그인 없이 허용, 그 외에는 관리자 권한 필요
+async def require_metrics_access(
+    request: Request,
+    db: LazyAsyncSession = Depends(get_lazy_async_db),
+    access_token: str = Depends(get_access_token),
+    refresh_token: str = Depends(get_refresh_token),
+) -> None:
+    if request.client and _is_metrics_network(request.client.host):
+        return
+
+    user = await get_current_user_async(request, db, access_token, refresh_token)
+    await require_admin_async(user)
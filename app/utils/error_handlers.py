@@ -1,10 +1,88 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+from config.settings import settings
 from fastapi import Request, status
-from fastapi.responses import HTMLResponse
+from fastapi.responses import Response
+from utils.cache import TTLCache
 from utils.logger import main_logger
 from utils.path import templates
 
 
+# 에러 로그 집계
+# - 에러마다 로그를 남기지 않고 (상태 코드, 경로)별 횟수를 모아서 interval마다 한 줄로 기록
+# - 기록은 run() 태스크(lifespan)가 주기적으로 실행하므로 에러가 한 번 몰리고 끊겨도 다음 주기에 기록됨
+# - 서로 다른 경로가 max_paths개를 넘으면 나머지는 상태 코드별 <other>로 합침
+class ErrorLogAggregator:
+    def __init__(self, interval: float, max_paths: int):
+        self.interval = interval
+        self.max_paths = max_paths
+        self.counts: dict[tuple[int, str], int] = {}
+        self._started = time.monotonic()
+
+    def record(self, status_code: int, path: str) -> None:
+        key = (status_code, path)
+        if key not in self.counts and len(self.counts) >= self.max_paths:
+            key = (status_code, "<other>")
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    # 모인 횟수 기록 (많은 순서)
+    def flush(self) -> None:
+        now = time.monotonic()
+        if self.counts:
+            ranked = sorted(self.counts.items(), key=lambda i: i[1], reverse=True)
+            main_logger.warning(
+                "에러 응답 %d건 (%.0f초 동안): %s",
+                sum(self.counts.values()),
+                now - self._started,
+                ", ".join(f"{code} {path} x{count}" for (code, path), count in ranked),
+            )
+        self.counts = {}
+        self._started = now
+
+    # 주기적 기록 (lifespan에서 백그라운드 태스크로 실행)
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+
+error_log = ErrorLogAggregator(
+    interval=settings.ERROR_LOG_INTERVAL_SECONDS,
+    max_paths=settings.ERROR_LOG_MAX_PATHS,
+)
+
+# 직렬화된 JSON 에러 본문 ((상태 코드, detail) → 본문)
+_json_bodies: TTLCache[bytes] = TTLCache(max_size=256)
+
+
+# HTML을 받는 클라이언트인지 확인 (브라우저 페이지 이동은 text/html을 요청)
+def accepts_html(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return "text/html" in accept or "application/xhtml+xml" in accept
+
+
+# JSON 에러 본문 ({"detail": ...}, 같은 내용은 한 번만 직렬화)
+def _json_body(status_code: int, detail: Any) -> bytes:
+    try:
+        key = (status_code, detail)
+        body = _json_bodies.get(key)
+    except TypeError:  # dict 등 해시할 수 없는 detail
+        return json.dumps({"detail": detail}, ensure_ascii=False).encode()
+    if body is None:
+        body = json.dumps(
+            {"detail": detail}, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+        _json_bodies.set(key, body)
+    return body
+
+
 # 공통 에러 응답
+# - HTML을 받지 않는 클라이언트(API 호출, 봇 등)에는 {"detail": ...} JSON
+# - HTML은 에러 코드별로 렌더링 결과를 캐시
+# - 로그는 경로별 횟수로 집계해서 기록 (500은 원인 확인을 위해 바로 기록)
 def error_response(
     request: Request,
     error_code: int,
@@ -12,14 +90,34 @@ def error_response(
     error_message: str,
     exc,
     status_code: int | None = None,
-) -> HTMLResponse:
+) -> Response:
     if status_code is None:
         status_code = error_code
 
-    main_logger.error(f"{error_code} {error_title} {error_message}")
-    main_logger.error(f"DETAIL: {exc.detail}")
+    detail = getattr(exc, "detail", None)
+    error_log.record(error_code, request.url.path)
+    if error_code >= 500:
+        main_logger.error(
+            "%s %s %s %s - %r",
+            error_code,
+            error_title,
+            request.method,
+            request.url.path,
+            exc,
+        )
+        # 내부 오류 내용은 응답에 포함하지 않음
+        detail = error_title
+
+    headers = getattr(exc, "headers", None)
+    if not accepts_html(request):
+        return Response(
+            _json_body(status_code, detail if detail is not None else error_title),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
 
-    return templates.TemplateResponse(
+    return templates.cached_response(
         request,
         "error.html",
         {
@@ -27,12 +125,14 @@ def error_response(
             "error_title": error_title,
             "error_message": error_message,
         },
+        keys=("error_code", "error_title", "error_message"),
         status_code=status_code,
+        headers=headers,
     )
 
 
 # 401 인증 실패 에러 응답
-def unauthorized_error(request: Request, exc) -> HTMLResponse:
+def unauthorized_error(request: Request, exc) -> Response:
     """401 인증 실패 에러 응답"""
     return error_response(
         request,
@@ -45,7 +145,7 @@ def unauthorized_error(request: Request, exc) -> HTMLResponse:
 
 
 # 403 권한 없음 에러 응답
-def forbidden_error(request: Request, exc) -> HTMLResponse:
+def forbidden_error(request: Request, exc) -> Response:
     """403 권한 없음 에러 응답"""
     return error_response(
         request,
@@ -58,7 +158,7 @@ def forbidden_error(request: Request, exc) -> HTMLResponse:
 
 
 # 404 페이지 없음 에러 응답
-def not_found_error(request: Request, exc) -> HTMLResponse:
+def not_found_error(request: Request, exc) -> Response:
     """404 페이지 없음 에러 응답"""
     return error_response(
         request,
@@ -71,7 +171,7 @@ def not_found_error(request: Request, exc) -> HTMLResponse:
 
 
 # 500 서버 오류 응답
-def internal_server_error(request: Request, exc) -> HTMLResponse:
+def internal_server_error(request: Request, exc) -> Response:
     """500 서버 오류 응답"""
     return error_response(
         request,
@@ -0,0 +1,7 @@
+# If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -0,0 +1,175 @@
+import asyncio
+import json
+from typing import Callable
+from uuid import uuid4
+
+import asyncpg
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger("app.invalidation")
+
+# 이벤트 종류
+USER_UPDATED = "user_updated"
+USER_DELETED = "user_deleted"
+TOKEN_REVOKED = "token_revoked"
+USER_AUTH_CHANGED = "user_auth_changed"  # 키: username (복제본 대신 주 DB에서 인증)
+
+
+# 워커 간 캐시 무효화 버스 (Postgres LISTEN/NOTIFY)
+# - 전용 asyncpg 커넥션으로 NOTIFY를 보내고 같은 채널을 LISTEN
+# - 다른 워커가 보낸 이벤트를 받으면 이벤트별 핸들러로 로컬 캐시 항목 제거
+# - 커넥션이 끊기면 놓친 이벤트가 있을 수 있으므로 flush 핸들러로 캐시 전체를 비우고
+#   지수 백오프로 재연결
+class InvalidationBus:
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        ping_interval: float = 30,
+        initial_backoff: float = 1,
+        max_backoff: float = 30,
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.ping_interval = ping_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.origin = uuid4().hex  # 자신이 보낸 이벤트는 무시
+        self.published = 0
+        self.received = 0
+        self.reconnects = 0
+        self.flushes = 0
+        self._handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._flush_handlers: list[Callable[[], None]] = []
+        self._conn: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._connected = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    # 이벤트 핸들러 등록 (handler(key))
+    def subscribe(self, event: str, handler: Callable[[str], None]) -> None:
+        self._handlers.setdefault(event, []).append(handler)
+
+    # 연결이 끊겼을 때 호출할 전체 flush 핸들러 등록
+    def on_flush(self, handler: Callable[[], None]) -> None:
+        self._flush_handlers.append(handler)
+
+    # 무효화 이벤트 발행 (연결되어 있지 않으면 무시)
+    async def publish(self, event: str, key: str) -> None:
+        if self._conn is None:
+            return
+
+        payload = json.dumps({"origin": self.origin, "event": event, "key": key})
+        try:
+            async with self._lock:
+                await self._conn.execute(
+                    "SELECT pg_notify($1, $2)", self.channel, payload
+                )
+            self.published += 1
+        except Exception:
+            logger.warning("무효화 이벤트 발행 실패 - %s %s", event, key, exc_info=True)
+
+    # 연결될 때까지 대기
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    def _on_notify(self, conn, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") == self.origin:
+            return
+
+        self.received += 1
+        for handler in self._handlers.get(message.get("event"), []):
+            try:
+                handler(message.get("key"))
+            except Exception:
+                logger.exception("무효화 이벤트 처리 실패 - %s", message)
+
+    def _flush(self) -> None:
+        self.flushes += 1
+        for handler in self._flush_handlers:
+            try:
+                handler()
+            except Exception:
+                logger.exception("캐시 flush 실패")
+
+    # 연결 유지 루프
+    async def _run(self) -> None:
+        backoff = self.initial_backoff
+        had_connection = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                await conn.add_listener(self.channel, self._on_notify)
+
+                if had_connection:
+                    # 끊긴 동안 놓친 이벤트가 있을 수 있음
+                    self.reconnects += 1
+                    self._flush()
+                    logger.info("무효화 버스 재연결")
+                had_connection = True
+                backoff = self.initial_backoff
+                self._conn = conn
+                self._connected.set()
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), self.ping_interval)
+                    except asyncio.TimeoutError:
+                        async with self._lock:
+                            await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("무효화 버스 연결 오류", exc_info=True)
+            finally:
+                self._conn = None
+                self._connected.clear()
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+            if had_connection:
+                self._flush()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    # 버스 시작 (lifespan)
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    # 버스 종료 (lifespan)
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # 버스 상태 반환
+    def stats(self) -> dict:
+        return {
+            "connected": self.connected,
+            "published": self.published,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "flushes": self.flushes,
+        }
+
+
+invalidation_bus = InvalidationBus(
+    settings.SQLALCHEMY_DATABASE_URL, settings.CACHE_INVALIDATION_CHANNEL
+)
@@ -1,52 +1,155 @@
+import atexit
+import gzip
+import json
 import logging
-from logging.config import dictConfig
+import os
+import queue
+import random
+import shutil
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+from config.settings import settings
 from utils.path import LOG_DIR
 
-# 로깅 설정
-LOGGING_CONFIG = {
-    "version": 1,
-    "formatters": {
-        "default": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# 한 줄짜리 JSON 로그 포맷
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
         }
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "level": "INFO",
-        },
-        "app_file": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": LOG_DIR / "app.log",
-            "maxBytes": 1024 * 1024 * 5,  # 5MB
-            "backupCount": 5,
-            "formatter": "default",
-        },
-        "db_file": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": LOG_DIR / "db.log",
-            "maxBytes": 1024 * 1024 * 5,  # 5MB
-            "backupCount": 5,
-            "formatter": "default",
-        },
-    },
-    "root": {
-        "handlers": ["console", "app_file"],
-        "level": "INFO",
-    },
-    "loggers": {
-        "sqlalchemy.engine": {
-            "handlers": ["db_file"],
-            "level": "INFO",
-            "propagate": False,
-        },
-    },
-}
-
-dictConfig(LOGGING_CONFIG)
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+# 로거별 샘플링 필터
+# - rates: {"로거 이름 접두어": 남길 비율(0~1)}, 가장 긴 접두어 기준
+# - WARNING 이상은 항상 남김
+class SamplingFilter(logging.Filter):
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = sorted(rates.items(), key=lambda i: len(i[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return rate >= 1 or random.random() < rate
+        return True
+
+
+# 로그 레코드를 포맷하지 않은 채로 큐에 넣는 핸들러
+# - 메시지 포맷(% 치환, 예외 문자열 변환)은 리스너 스레드에서 처리
+# - 같은 프로세스 안에서만 사용하므로 레코드를 복사하거나 직렬화하지 않음
+class LazyQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# 교체된 로그 파일 gzip 압축 (app.log.1 → app.log.1.gz)
+# - 파일 핸들러는 리스너 스레드에서 실행되므로 압축도 이벤트 루프 밖에서 처리
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _file_handler(filename: str) -> RotatingFileHandler:
+    handler = RotatingFileHandler(
+        LOG_DIR / filename,
+        maxBytes=1024 * 1024 * 5,  # 5MB
+        backupCount=5,
+        encoding="utf-8",
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+# "로거=비율,로거=비율" 형식의 샘플링 설정 파싱
+def parse_sample_rates(value: str) -> dict[str, float]:
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+# 로깅 설정
+# - 로거에는 큐 핸들러만 붙이고, 실제 출력(콘솔/파일)은 백그라운드 리스너 스레드에서 처리
+# - app: 콘솔 + app.log, db: db.log (SQLAlchemy, 느린 쿼리 로그)
+def configure_logging() -> list[QueueListener]:
+    if settings.LOG_FORMAT == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", DATE_FORMAT
+        )
+
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    app_file = _file_handler("app.log")
+    db_file = _file_handler("db.log")
+    for handler in (console, app_file, db_file):
+        handler.setFormatter(formatter)
+
+    sampling = SamplingFilter(parse_sample_rates(settings.LOG_SAMPLE_RATES))
+    listeners = []
+
+    def queue_handler(*handlers: logging.Handler) -> QueueHandler:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = LazyQueueHandler(log_queue)
+        handler.addFilter(sampling)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        listeners.append(listener)
+        return handler
+
+    app_queue = queue_handler(console, app_file)
+    db_queue = queue_handler(db_file)
+
+    root = logging.getLogger()
+    root.handlers = [app_queue]
+    root.setLevel(logging.INFO)
+
+    # SQLAlchemy는 로거 레벨이 INFO면 echo 설정과 무관하게 모든 쿼리를 기록
+    # 풀 로거 이름은 풀 클래스 경로이므로 config.db.InstrumentedQueuePool도 sqlalchemy.pool과 같이 설정
+    # 느린 쿼리 / 샘플링 쿼리 로그는 app.db
+    for name, level in (
+        ("sqlalchemy.engine", logging.INFO if settings.DB_ECHO else logging.WARNING),
+        ("sqlalchemy.pool", logging.WARNING),
+        ("config.db.InstrumentedQueuePool", logging.WARNING),
+        ("app.db", logging.INFO),
+    ):
+        logger = logging.getLogger(name)
+        logger.handlers = [db_queue]
+        logger.setLevel(level)
+        logger.propagate = False
+
+    return listeners
+
+
+# 종료 시 큐에 남은 로그를 모두 기록
+def _stop_listeners(listeners: list[QueueListener]) -> None:
+    for listener in listeners:
+        listener.stop()
+
+
+_listeners = configure_logging()
+atexit.register(_stop_listeners, _listeners)
 
 
 # 로거 인스턴스 반환
@@ -0,0 +1,236 @@
+import bisect
+from typing import Any, Callable, Iterable, TypeVar
+
+# 기본 지연시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# 메트릭 공통
+# - 이벤트 루프 단일 스레드에서 갱신하므로 락 없이 dict 값만 변경
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+
+    def samples(self) -> Iterable[tuple[str, Labels, Labels, float]]:
+        return ()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for suffix, names, values, value in self.samples():
+            lines.append(
+                f"{self.name}{suffix}{_format_labels(names, values)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+# 증가만 하는 카운터
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()):
+        super().__init__(name, help, labelnames)
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield "", self.labelnames, labels, value
+
+
+# 증가/감소하는 게이지
+class Gauge(Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()):
+        super().__init__(name, help, labelnames)
+        self.values: dict[Labels, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self.values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield "", self.labelnames, labels, value
+
+
+# 조회 시점에 콜백으로 값을 계산하는 메트릭 (풀 사용량, 캐시 적중률 등)
+# - fn은 {레이블 값 튜플: 값}을 반환
+class CallbackMetric(Metric):
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], dict[Labels, float]],
+        labelnames: Labels = (),
+        type: str = "gauge",
+    ):
+        super().__init__(name, help, labelnames)
+        self.fn = fn
+        self.type = type
+
+    def samples(self):
+        for labels, value in self.fn().items():
+            yield "", self.labelnames, labels, value
+
+
+# 히스토그램
+# - 레이블별로 버킷 카운트(누적 아님), 합계, 개수를 저장하고 출력할 때 누적
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = buckets
+        self.values: dict[Labels, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def samples(self):
+        names = self.labelnames + ("le",)
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, bucket in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket
+                yield "_bucket", names, labels + (_format_value(bound),), cumulative
+            yield "_sum", self.labelnames, labels, total
+            yield "_count", self.labelnames, labels, count
+
+
+M = TypeVar("M", bound=Metric)
+
+
+# 메트릭 레지스트리
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Labels = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Labels = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], dict[Labels, float]],
+        labelnames: Labels = (),
+        type: str = "gauge",
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, help, fn, labelnames, type))
+
+    # Prometheus 텍스트 형식(0.0.4)으로 출력
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics.values():
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP 요청 메트릭 (MetricsMiddleware에서 갱신)
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초)",
+    ("method", "route", "status"),
+)
+
+# 리프레시 토큰 회전 결과 (rotated, rejected)
+token_refresh_total = registry.counter(
+    "token_refresh_total", "리프레시 토큰 갱신 시도 수", ("result",)
+)
+
+# 캐시 적중률 메트릭 (hits, misses 속성이 있는 캐시)
+_caches: dict[str, Any] = {}
+
+
+def register_cache(name: str, cache: Any) -> None:
+    _caches[name] = cache
+
+
+def _cache_hit_ratio() -> dict[Labels, float]:
+    ratios = {}
+    for name, cache in _caches.items():
+        total = cache.hits + cache.misses
+        ratios[(name,)] = cache.hits / total if total else 0.0
+    return ratios
+
+
+registry.callback(
+    "cache_hits_total",
+    "캐시 적중 수",
+    lambda: {(name,): cache.hits for name, cache in _caches.items()},
+    ("cache",),
+    "counter",
+)
+registry.callback(
+    "cache_misses_total",
+    "캐시 미스 수",
+    lambda: {(name,): cache.misses for name, cache in _caches.items()},
+    ("cache",),
+    "counter",
+)
+registry.callback("cache_hit_ratio", "캐시 적중률", _cache_hit_ratio, ("cache",))
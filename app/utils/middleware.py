@@ -0,0 +1,237 @@
+import time
+
+from config.settings import settings
+from fastapi.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.logger import main_logger
+from utils.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+from utils.tracing import TraceBuffer, end_trace, start_trace
+
+
+# HTTP 요청 로깅 미들웨어 (순수 ASGI)
+# - 모든 HTTP 요청과 응답을 로깅 (health check 제외)
+# - 요청 시간, 메서드, URL, 상태 코드, 응답 시간 등을 기록
+# - 응답 본문은 그대로 흘려보내고 마지막 본문 메시지가 전송될 때 완료 로그를 남김
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # health check 경로는 로깅하지 않음
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        user_agent = "Unknown"
+        for key, value in scope["headers"]:
+            if key == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
+
+        # 요청 시작 시간 기록
+        start_time = time.perf_counter()
+
+        # 요청 정보 로깅
+        main_logger.info(
+            "요청 시작 - %s %s 클라이언트: %s User-Agent: %s",
+            method,
+            path,
+            client[0] if client else "Unknown",
+            user_agent,
+        )
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # 성공 응답 로깅
+                main_logger.info(
+                    "요청 완료 - %s %s 상태: %d 처리시간: %.3f초",
+                    method,
+                    path,
+                    status_code,
+                    time.perf_counter() - start_time,
+                )
+
+        try:
+            # 다음 미들웨어 또는 엔드포인트 실행
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # 에러 발생 시 로깅
+            main_logger.error(
+                "요청 실패 - %s %s 에러: %s 처리시간: %.3f초",
+                method,
+                path,
+                e,
+                time.perf_counter() - start_time,
+            )
+            raise
+
+
+# 쿠키 설정 헤더 값 생성 (Response.set_cookie와 같은 형식)
+def _cookie_header(key: str, value: str, max_age: int) -> str:
+    response = Response()
+    response.set_cookie(
+        key=key,
+        value=value,
+        httponly=True,
+        secure=True,
+        samesite="strict",
+        max_age=max_age,
+    )
+    return response.headers["set-cookie"]
+
+
+# 토큰 갱신 미들웨어 (순수 ASGI)
+# - 인증 의존성이 request.state(scope["state"])에 남긴 새 토큰을
+#   http.response.start 메시지의 헤더에 쿠키로 추가
+class TokenRefreshMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state = scope.get("state") or {}
+                new_access_token = state.get("new_access_token")
+                new_refresh_token = state.get("new_refresh_token")
+                if new_access_token or new_refresh_token:
+                    headers = MutableHeaders(scope=message)
+                    if new_access_token:
+                        main_logger.info(
+                            "액세스 토큰 갱신 - %s %s", scope["method"], scope["path"]
+                        )
+                        headers.append(
+                            "set-cookie",
+                            _cookie_header(
+                                "access_token",
+                                new_access_token,
+                                int(settings.JWT_ACCESS_EXPIRES_IN_HOURS * 3600),
+                            ),
+                        )
+                    if new_refresh_token:
+                        main_logger.info(
+                            "리프레시 토큰 갱신 - %s %s", scope["method"], scope["path"]
+                        )
+                        headers.append(
+                            "set-cookie",
+                            _cookie_header(
+                                "refresh_token",
+                                new_refresh_token,
+                                int(settings.JWT_REFRESH_EXPIRES_IN_DAYS * 24 * 3600),
+                            ),
+                        )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# 요청의 라우트 템플릿 (예: /admin/user/{id})
+# - 경로 그대로 쓰면 레이블 종류가 무한히 늘어나므로 매칭된 라우트의 경로만 사용
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if "endpoint" in scope:
+        # 마운트된 앱 (정적 파일 등)
+        return scope.get("root_path") or "<mount>"
+    return "<unmatched>"
+
+
+# 요청 메트릭 미들웨어 (순수 ASGI)
+# - 라우트 템플릿 / 상태 코드별 요청 수와 처리 시간, 처리 중인 요청 수 기록
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            labels = (scope["method"], _route_template(scope), str(status_code))
+            http_requests_total.inc(*labels)
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start_time, *labels
+            )
+
+
+# 최근 느린 요청 Trace (GET /admin/traces)
+slow_traces = TraceBuffer(settings.TRACE_BUFFER_SIZE)
+
+
+# 요청 구간 추적 미들웨어 (순수 ASGI)
+# - JWT 검증, 커넥션 checkout, SQL, bcrypt, 템플릿 렌더링 구간을 요청별로 기록
+# - TRACE_SERVER_TIMING이면 응답에 Server-Timing 헤더 추가
+# - TRACE_SLOW_SECONDS 이상 걸린 요청은 링 버퍼에 보관
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.TRACE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        trace, token = start_trace()
+        server_timing = settings.TRACE_SERVER_TIMING
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if server_timing:
+                    MutableHeaders(scope=message).append(
+                        "server-timing",
+                        trace.server_timing(time.perf_counter() - trace.start),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_trace(token)
+            duration = time.perf_counter() - trace.start
+            if duration >= settings.TRACE_SLOW_SECONDS:
+                slow_traces.add(
+                    trace.to_dict(
+                        duration,
+                        method=scope["method"],
+                        route=_route_template(scope),
+                        path=scope["path"],
+                        status=status_code,
+                    )
+                )
@@ -0,0 +1,96 @@
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Literal
+
+# 파티션 구간 단위
+PartitionInterval = Literal["day", "week"]
+
+_STEPS = {"d": timedelta(days=1), "w": timedelta(weeks=1)}
+
+
+# 구간 길이
+def partition_step(interval: PartitionInterval) -> timedelta:
+    return _STEPS[interval[0]]
+
+
+# 구간 시작일 (UTC, week는 월요일 기준)
+def partition_start(moment: datetime, interval: PartitionInterval) -> date:
+    day = moment.astimezone(timezone.utc).date()
+    if interval == "week":
+        day -= timedelta(days=day.weekday())
+    return day
+
+
+# 파티션 이름 (예: refresh_tokens_w20261019)
+# - 이름에 구간 단위와 시작일이 들어 있으므로 이름만으로 범위를 알 수 있음
+def partition_name(table: str, start: date, interval: PartitionInterval) -> str:
+    return f"{table}_{interval[0]}{start:%Y%m%d}"
+
+
+# 파티션 이름에서 (시작일, 종료일) 추출 (형식이 다르면 None)
+def parse_partition_name(table: str, name: str) -> tuple[date, date] | None:
+    match = re.fullmatch(rf"{re.escape(table)}_([dw])(\d{{8}})", name)
+    if not match:
+        return None
+    start = datetime.strptime(match.group(2), "%Y%m%d").date()
+    return start, start + _STEPS[match.group(1)]
+
+
+# 기존 파티션 이름에서 구간 단위 추출 (가장 최근 파티션 기준, 형식에 맞는 파티션이 없으면 None)
+def detect_interval(table: str, names: Iterable[str]) -> PartitionInterval | None:
+    bounds = sorted(filter(None, (parse_partition_name(table, n) for n in names)))
+    if not bounds:
+        return None
+    start, end = bounds[-1]
+    return "day" if end - start == _STEPS["d"] else "week"
+
+
+# 기본 파티션 이름
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+# start ~ end 시각을 모두 덮는 파티션 목록 [(이름, 시작일, 종료일)]
+def planned_partitions(
+    table: str, interval: PartitionInterval, start: datetime, end: datetime
+) -> list[tuple[str, date, date]]:
+    step = partition_step(interval)
+    day = partition_start(start, interval)
+    last = partition_start(end, interval)
+    partitions = []
+    while day <= last:
+        partitions.append((partition_name(table, day, interval), day, day + step))
+        day += step
+    return partitions
+
+
+# 파티션 생성 SQL (이름과 범위는 날짜로만 만들어지므로 그대로 사용)
+def create_partition_sql(table: str, name: str, start: date, end: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+        f"TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+# 범위에 맞는 파티션이 없는 행을 받는 기본 파티션 생성 SQL
+def create_default_partition_sql(table: str) -> str:
+    name = default_partition_name(table)
+    return f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} DEFAULT"
+
+
+# 테이블이 파티션 테이블인지 확인하는 SQL
+def is_partitioned_sql(table: str) -> str:
+    return (
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        f"WHERE partrelid = to_regclass('{table}'))"
+    )
+
+
+# 파티션 이름 목록 조회 SQL
+def list_partitions_sql(table: str) -> str:
+    return (
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        f"WHERE i.inhparent = to_regclass('{table}')"
+    )
@@ -0,0 +1,20 @@
+from passlib.context import CryptContext
+
+# 비밀번호 해시 컨텍스트
+# - 프로세스 풀 워커에서도 import 되므로 가벼운 의존성만 사용
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# 비밀번호 해시화
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+# 비밀번호 여러 개 해시화 (프로세스 풀 작업 하나로 묶어서 IPC 비용 절감)
+def hash_passwords(passwords: list[str]) -> list[str]:
+    return [pwd_context.hash(password) for password in passwords]
+
+
+# 비밀번호 검증
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
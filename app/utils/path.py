@@ -1,6 +1,15 @@
+import hashlib
 from pathlib import Path
+from typing import Any
 
+from fastapi import Request
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from utils.cache import TTLCache
+from utils.http_cache import etag_matches
+from utils.metrics import register_cache
+from utils.tracing import span
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -12,5 +21,106 @@ UPLOAD_DIR.mkdir(exist_ok=True, parents=True)
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True, parents=True)
 
+
+# 템플릿 바이트코드 캐시 디렉토리 (빌드 단계에서 미리 생성)
+TEMPLATE_CACHE_DIR = BASE_DIR / "template_cache"
+
+
+# 저장에 실패해도 렌더링은 계속하는 바이트코드 캐시
+# - 실행 계정이 쓸 수 없는 디렉토리면 빌드 단계에서 만든 캐시를 읽기만 함
+class ReadOnlySafeBytecodeCache(FileSystemBytecodeCache):
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+# 렌더링된 페이지 캐시 항목
+class RenderedPage:
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+# 템플릿
+# - 렌더링 시간을 template 구간으로 기록 (TemplateResponse는 생성 시점에 렌더링)
+# - 바이트코드 캐시: 템플릿 소스 체크섬별로 컴파일 결과를 저장하므로 템플릿이 바뀌면 다시 컴파일
+# - cached_response: 템플릿 이름 + 선언한 컨텍스트 키 값별로 렌더링 결과를 캐시
+class Templates(Jinja2Templates):
+    def __init__(self, directory: Path, bytecode_dir: Path):
+        super().__init__(directory=directory)
+        try:
+            bytecode_dir.mkdir(exist_ok=True)
+            self.env.bytecode_cache = ReadOnlySafeBytecodeCache(str(bytecode_dir))
+        except OSError:
+            self.env.bytecode_cache = ReadOnlySafeBytecodeCache()
+        self.page_cache_enabled = True
+        self.pages: TTLCache[RenderedPage] = TTLCache(max_size=256)
+
+    def TemplateResponse(self, *args, **kwargs):
+        with span("template"):
+            return super().TemplateResponse(*args, **kwargs)
+
+    # 설정 적용 (main.py에서 호출)
+    # - auto_reload: 템플릿 파일이 바뀌면 다시 로드 (개발용, 렌더링 결과 캐시 사용 안 함)
+    def configure(self, auto_reload: bool, page_cache_size: int) -> None:
+        self.env.auto_reload = auto_reload
+        self.page_cache_enabled = not auto_reload and page_cache_size > 0
+        self.pages.max_size = page_cache_size
+        self.pages.clear()
+
+    # 모든 템플릿 미리 컴파일 (첫 요청에서 컴파일하지 않도록)
+    def precompile(self) -> int:
+        names = self.env.list_templates(extensions=["html"])
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
+    # 캐시된 렌더링 결과로 응답
+    # - keys: 출력에 영향을 주는 컨텍스트 키 (나머지 값은 캐시 키에 포함되지 않음)
+    # - headers: 응답에 추가할 헤더 (예: WWW-Authenticate)
+    # - 200 응답은 ETag를 붙이고 If-None-Match가 일치하면 304
+    def cached_response(
+        self,
+        request: Request,
+        name: str,
+        context: dict[str, Any] | None = None,
+        keys: tuple[str, ...] = (),
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> HTMLResponse:
+        context = context or {}
+        if not self.page_cache_enabled:
+            return self.TemplateResponse(
+                request, name, context, status_code=status_code, headers=headers
+            )
+
+        cache_key = (name, tuple(context.get(key) for key in keys))
+        page = self.pages.get(cache_key)
+        if page is None:
+            with span("template"):
+                template = self.get_template(name)
+                page = RenderedPage(
+                    template.render({**context, "request": request}).encode()
+                )
+            self.pages.set(cache_key, page)
+
+        headers = {**(headers or {}), "Cache-Control": "no-cache"}
+        if status_code == 200:
+            headers["ETag"] = page.etag
+            if etag_matches(request.headers.get("if-none-match", ""), page.etag):
+                return HTMLResponse(status_code=304, headers=headers)
+        return HTMLResponse(page.body, status_code=status_code, headers=headers)
+
+
 # 템플릿 디렉토리
-templates = Jinja2Templates(directory=BASE_DIR / "templates")
+templates = Templates(BASE_DIR / "templates", TEMPLATE_CACHE_DIR)
+register_cache("rendered_pages", templates.pages)
+
+
+# 빌드 단계에서 미리 컴파일해서 바이트코드 캐시 생성 (python -m utils.path)
+if __name__ == "__main__":
+    print(f"compiled {templates.precompile()} templates → {TEMPLATE_CACHE_DIR}")
@@ -0,0 +1,75 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+# 풀이 가득 찼을 때 발생하는 예외
+class PoolBusyError(Exception):
+    pass
+
+
+# 대기열 크기가 제한된 비동기 프로세스 풀
+# - CPU를 오래 점유하는 작업(bcrypt 등)을 이벤트 루프 밖에서 실행
+# - 실행 중 + 대기 중인 작업이 max_workers + max_queue를 넘으면 PoolBusyError
+# - 워커 프로세스는 첫 작업 제출 시 생성
+class BoundedProcessPool:
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    # 작업 실행 (대기열이 가득 차면 PoolBusyError)
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PoolBusyError("process pool queue is full")
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            latency = time.perf_counter() - start
+            self.pending -= 1
+            self.completed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    # 풀 종료
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # 풀 통계 반환
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self.pending,
+            "queued": max(self.pending - self.max_workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_latency": (
+                self.total_latency / self.completed if self.completed else 0.0
+            ),
+            "max_latency": self.max_latency,
+        }
@@ -0,0 +1,124 @@
+import bisect
+import random
+import re
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from utils.logger import get_logger
+
+logger = get_logger("app.db")
+
+# 지연시간 히스토그램 버킷 경계 (초)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_WHITESPACE = re.compile(r"\s+")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+# SQL 정규화
+# - 공백 정리, 바인드 파라미터를 ?로 통일, IN (?, ?, ...) 목록을 (?...)로 축약
+def normalize_sql(statement: str) -> str:
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _BIND_PARAM.sub("?", sql)
+    return _PARAM_LIST.sub("(?...)", sql)
+
+
+# 로그에 남길 파라미터 마스킹 (값 대신 타입 이름만 기록)
+def redact_parameters(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return [redact_parameters(p) for p in parameters[:3]] + (
+                ["..."] if len(parameters) > 3 else []
+            )
+        return tuple(f"<{type(value).__name__}>" for value in parameters)
+    return f"<{type(parameters).__name__}>"
+
+
+# 정규화된 SQL별 실행 통계
+class QueryStats:
+    def __init__(
+        self, slow_threshold: float, sample_rate: float, max_statements: int = 1000
+    ):
+        self.slow_threshold = slow_threshold
+        self.sample_rate = sample_rate
+        self.max_statements = max_statements
+        self.slow_count = 0
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    # 실행 시간 기록
+    def record(self, statement: str, parameters: Any, elapsed: float) -> None:
+        sql = normalize_sql(statement)
+        entry = self._stats.get(sql)
+        if entry is None:
+            # 서로 다른 SQL이 너무 많으면 하나로 합쳐서 메모리 사용량 제한
+            if len(self._stats) >= self.max_statements:
+                sql = "<other>"
+                entry = self._stats.get(sql)
+            if entry is None:
+                entry = self._stats[sql] = {
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                }
+
+        entry["count"] += 1
+        entry["total"] += elapsed
+        entry["max"] = max(entry["max"], elapsed)
+        entry["buckets"][bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+        if elapsed >= self.slow_threshold:
+            self.slow_count += 1
+            logger.warning(
+                "느린 쿼리 %.3f초: %s 파라미터: %s",
+                elapsed,
+                sql,
+                redact_parameters(parameters),
+            )
+        elif self.sample_rate and random.random() < self.sample_rate:
+            logger.info("쿼리 %.3f초: %s", elapsed, sql)
+
+    # 총 실행 시간 기준 상위 N개 SQL
+    def top(self, limit: int = 20) -> list[dict[str, Any]]:
+        ranked = sorted(self._stats.items(), key=lambda i: i[1]["total"], reverse=True)
+        return [
+            {
+                "sql": sql,
+                "count": entry["count"],
+                "total": entry["total"],
+                "avg": entry["total"] / entry["count"],
+                "max": entry["max"],
+                "histogram": dict(
+                    zip(
+                        [f"<={b}" for b in LATENCY_BUCKETS] + ["inf"],
+                        entry["buckets"],
+                    )
+                ),
+            }
+            for sql, entry in ranked[:limit]
+        ]
+
+    # 통계 초기화
+    def clear(self) -> None:
+        self._stats.clear()
+        self.slow_count = 0
+
+
+# 엔진에 실행 시간 측정 이벤트 등록
+# - 시작 시각은 실행 컨텍스트에 저장하므로 실패한 실행이 남기는 상태가 없음
+def install_query_stats(engine: Engine, stats: QueryStats) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._query_start_time = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = getattr(context, "_query_start_time", None)
+        if start is not None:
+            stats.record(statement, parameters, time.perf_counter() - start)
@@ -0,0 +1,302 @@
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Any
+
+from starlette.exceptions import HTTPException
+from starlette.types import Receive, Scope, Send
+from utils.http_cache import etag_matches
+from utils.path import BASE_DIR
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger("app.static")
+
+# 압축본을 만들 파일 확장자 (이미지 등 이미 압축된 형식 제외)
+COMPRESSIBLE = {".css", ".js", ".json", ".webmanifest", ".svg", ".html", ".txt"}
+
+# 고정 URL로 제공해야 하는 파일 (서비스 워커는 /service-worker.js 라우트에서 제공)
+EXCLUDED = {"service-worker.js"}
+
+# 파일 이름에 해시가 들어간 URL은 내용이 바뀌면 URL도 바뀌므로 영구 캐시
+IMMUTABLE = "public, max-age=31536000, immutable"
+# 원래 이름의 URL은 캐시하되 매번 ETag로 재검증
+REVALIDATE = "no-cache"
+
+# 선호하는 압축 방식 순서 (Content-Encoding 이름, 파일 확장자)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+
+# 내용 해시 (파일 이름, ETag에 사용)
+def fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+# 해시가 들어간 상대 경로 (예: css/base.css → css/base.3f2a1b9c0d4e.css)
+def hashed_path(path: str, digest: str) -> str:
+    stem, dot, suffix = path.rpartition(".")
+    if not dot or "/" in suffix:
+        return f"{path}.{digest}"
+    return f"{stem}.{digest}.{suffix}"
+
+
+# 압축본 생성 (원본보다 작은 경우만)
+def compress(data: bytes) -> dict[str, bytes]:
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return {name: body for name, body in variants.items() if len(body) < len(data)}
+
+
+# Accept-Encoding 헤더 파싱 ({이름: q값})
+def parse_accept_encoding(value: str) -> dict[str, float]:
+    accepted = {}
+    for item in value.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        key, _, number = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                q = float(number)
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    return accepted
+
+
+# 클라이언트가 받을 수 있는 압축 방식 중 선호 순서가 가장 앞선 것 (없으면 None)
+def choose_encoding(accept_encoding: str, available: dict[str, bytes]) -> str | None:
+    accepted = parse_accept_encoding(accept_encoding)
+    for name, _ in ENCODINGS:
+        if name in available and accepted.get(name, accepted.get("*", 0)) > 0:
+            return name
+    return None
+
+
+# 정적 파일 하나
+# - bodies: {None(원본) 또는 압축 방식: 본문}
+class Asset:
+    __slots__ = ("path", "hashed", "digest", "media_type", "bodies")
+
+    def __init__(self, path: str, data: bytes):
+        self.path = path
+        self.digest = fingerprint(data)
+        self.hashed = hashed_path(path, self.digest)
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type.endswith(
+            ("javascript", "json")
+        ):
+            media_type += "; charset=utf-8"
+        self.media_type = media_type
+        self.bodies: dict[str | None, bytes] = {None: data}
+
+    # 표현별 강한 ETag (압축본은 원본과 다른 바이트이므로 다른 ETag)
+    def etag(self, encoding: str | None) -> str:
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+
+# 정적 파일 빌드
+# - 파일마다 내용 해시를 붙인 이름으로 output_dir에 복사하고 .gz / .br 압축본과
+#   manifest.json(원래 경로 → 해시 경로)을 기록
+# - 이미 만들어진 압축본은 다시 압축하지 않고 읽어서 사용
+# - output_dir에 쓸 수 없으면 메모리에만 만들어서 사용
+def build_assets(source_dir: Path, output_dir: Path | None = None) -> list[Asset]:
+    assets = []
+    for file in sorted(source_dir.rglob("*")):
+        relative = file.relative_to(source_dir).as_posix()
+        if not file.is_file() or relative in EXCLUDED or file.name.startswith("."):
+            continue
+        asset = Asset(relative, file.read_bytes())
+        if file.suffix in COMPRESSIBLE:
+            asset.bodies.update(_load_or_compress(asset, output_dir))
+        assets.append(asset)
+
+    if output_dir is not None:
+        try:
+            _write_assets(assets, output_dir)
+        except OSError as e:
+            logger.warning("정적 파일 빌드 결과를 저장하지 못했습니다 - %s", e)
+    return assets
+
+
+def _load_or_compress(asset: Asset, output_dir: Path | None) -> dict[str, bytes]:
+    if output_dir is not None:
+        built = {
+            name: output_dir / (asset.hashed + suffix)
+            for name, suffix in ENCODINGS
+            if (output_dir / (asset.hashed + suffix)).is_file()
+        }
+        if "gzip" in built and ("br" in built or brotli is None):
+            return {name: path.read_bytes() for name, path in built.items()}
+    return compress(asset.bodies[None])
+
+
+def _write_assets(assets: list[Asset], output_dir: Path) -> None:
+    for asset in assets:
+        target = output_dir / asset.hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        for encoding, body in asset.bodies.items():
+            suffix = dict(ENCODINGS)[encoding] if encoding else ""
+            path = target.with_name(target.name + suffix)
+            if not path.exists():
+                path.write_bytes(body)
+    (output_dir / "manifest.json").write_text(
+        json.dumps({a.path: a.hashed for a in assets}, indent=2), encoding="utf-8"
+    )
+
+
+# 정적 파일 ASGI 앱 (StaticFiles 대신 마운트)
+# - 해시 경로: Cache-Control immutable, 원래 경로: no-cache (ETag로 재검증)
+# - Accept-Encoding에 따라 미리 압축한 br / gzip 본문 제공
+# - 강한 ETag, If-None-Match 일치 시 304
+# - 파일이 작으므로 모든 표현을 메모리에 올려두고 제공
+class StaticAssets:
+    def __init__(
+        self, directory: Path, build_dir: Path | None = None, prefix: str = "/static"
+    ):
+        self.prefix = prefix
+        self.assets = build_assets(directory, build_dir)
+        self._routes: dict[str, tuple[Asset, str]] = {}
+        for asset in self.assets:
+            self._routes["/" + asset.path] = (asset, REVALIDATE)
+            self._routes["/" + asset.hashed] = (asset, IMMUTABLE)
+        self._urls = {a.path: f"{prefix}/{a.hashed}" for a in self.assets}
+
+    # 템플릿에서 사용할 URL (예: asset("css/base.css") → /static/css/base.3f2a1b9c0d4e.css)
+    def url(self, path: str) -> str:
+        return self._urls.get(path) or f"{self.prefix}/{path}"
+
+    # 원래 경로 → 해시 URL
+    def manifest(self) -> dict[str, str]:
+        return dict(self._urls)
+
+    # 모든 파일 해시로 만든 버전 (파일이 하나라도 바뀌면 바뀜)
+    @property
+    def version(self) -> str:
+        return fingerprint("".join(a.digest for a in self.assets).encode())
+
+    # JS 모듈 import map
+    # - 모듈 안의 상대 경로 import (./form-utils.js)도 해시 URL로 연결
+    def import_map(self) -> dict[str, Any]:
+        return {
+            "imports": {
+                f"{self.prefix}/{path}": url
+                for path, url in self._urls.items()
+                if path.endswith(".js")
+            }
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        route = self._routes.get(path)
+        if route is None:
+            raise HTTPException(status_code=404)
+        asset, cache_control = route
+
+        headers = {}
+        for key, value in scope["headers"]:
+            if key in (b"accept-encoding", b"if-none-match"):
+                headers[key] = value.decode("latin-1")
+
+        encoding = choose_encoding(headers.get(b"accept-encoding", ""), asset.bodies)
+        etag = asset.etag(encoding)
+        response_headers = [
+            (b"etag", etag.encode()),
+            (b"cache-control", cache_control.encode()),
+        ]
+        if len(asset.bodies) > 1:
+            response_headers.append((b"vary", b"Accept-Encoding"))
+
+        if etag_matches(headers.get(b"if-none-match", ""), etag):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": response_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body = asset.bodies[encoding]
+        response_headers += [
+            (b"content-type", asset.media_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if encoding:
+            response_headers.append((b"content-encoding", encoding.encode()))
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": response_headers}
+        )
+        await send(
+            {"type": "http.response.body", "body": body if method == "GET" else b""}
+        )
+
+
+# 서비스 워커 스크립트
+# - 원본 스크립트 앞에 self.__SW_MANIFEST(배포 버전, 사전 캐시 URL, 앱 셸 페이지)를 붙여서 제공
+# - 버전은 정적 파일, 템플릿, 워커 스크립트 내용의 해시이므로 배포로 내용이 바뀌면
+#   스크립트도 바뀌고, 브라우저가 새 워커를 설치하면서 이전 버전 캐시를 지움
+class ServiceWorker:
+    def __init__(
+        self,
+        source: Path,
+        assets: StaticAssets,
+        pages: list[str],
+        template_dir: Path,
+    ):
+        script = source.read_bytes()
+        templates = b"".join(
+            file.read_bytes() for file in sorted(template_dir.rglob("*.html"))
+        )
+        self.version = fingerprint(
+            assets.version.encode() + fingerprint(templates).encode() + script
+        )
+        manifest = {
+            "version": self.version,
+            "precache": pages + list(assets.manifest().values()),
+            "pages": pages,
+        }
+        self.body = f"self.__SW_MANIFEST = {json.dumps(manifest)};\n".encode() + script
+        self.etag = f'"{self.version}"'
+
+
+# 앱에서 사용하는 정적 파일 (static → static_build)
+static_assets = StaticAssets(BASE_DIR / "static", BASE_DIR / "static_build")
+
+# 오프라인에서도 열 수 있도록 사전 캐시하는 앱 셸 페이지 (로그인 없이 보이는 페이지)
+SHELL_PAGES = ["/", "/introduction"]
+
+service_worker = ServiceWorker(
+    BASE_DIR / "static" / "service-worker.js",
+    static_assets,
+    SHELL_PAGES,
+    BASE_DIR / "templates",
+)
+
+
+# 빌드 단계에서 미리 실행 (python -m utils.static_assets)
+if __name__ == "__main__":
+    for asset in static_assets.assets:
+        sizes = ", ".join(
+            f"{encoding or 'identity'} {len(body)}"
+            for encoding, body in asset.bodies.items()
+        )
+        print(f"{asset.path} → {asset.hashed} ({sizes})")
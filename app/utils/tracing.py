@@ -0,0 +1,153 @@
+import time
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청 하나에 기록할 최대 구간 수 (쿼리가 많은 요청의 메모리 사용량 제한)
+MAX_SPANS = 200
+
+
+# 요청 하나의 구간 기록
+# - spans: (이름, 요청 시작 기준 시작 시각, 소요 시간) 목록 (초)
+class Trace:
+    __slots__ = ("start", "started_at", "spans", "dropped")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.started_at = time.time()
+        self.spans: list[tuple[str, float, float]] = []
+        self.dropped = 0
+
+    def add(self, name: str, start: float, duration: float) -> None:
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append((name, start - self.start, duration))
+        else:
+            self.dropped += 1
+
+    # 구간 이름별 (합계, 횟수)
+    def totals(self) -> dict[str, tuple[float, int]]:
+        totals: dict[str, tuple[float, int]] = {}
+        for name, _, duration in self.spans:
+            total, count = totals.get(name, (0.0, 0))
+            totals[name] = (total + duration, count + 1)
+        return totals
+
+    # Server-Timing 헤더 값 (예: sql;dur=1.204;desc="3", total;dur=4.512)
+    def server_timing(self, total: float) -> str:
+        entries = [
+            f'{name};dur={duration * 1000:.3f};desc="{count}"'
+            for name, (duration, count) in self.totals().items()
+        ]
+        entries.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(entries)
+
+    # 관리자 조회용 dict (밀리초 단위)
+    def to_dict(self, duration: float, **info: Any) -> dict[str, Any]:
+        return {
+            **info,
+            "duration_ms": round(duration * 1000, 3),
+            "started_at": datetime.fromtimestamp(
+                self.started_at, timezone.utc
+            ).isoformat(),
+            "totals": {
+                name: {"duration_ms": round(total * 1000, 3), "count": count}
+                for name, (total, count) in self.totals().items()
+            },
+            "spans": [
+                {
+                    "name": name,
+                    "start_ms": round(start * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for name, start, duration in self.spans
+            ],
+            "dropped_spans": self.dropped,
+        }
+
+
+# 현재 요청의 Trace (추적하지 않는 요청은 None)
+# - SQLAlchemy greenlet, 스레드풀로 실행되는 동기 함수에도 컨텍스트가 전달됨
+_current_trace: ContextVar[Trace | None] = ContextVar("trace", default=None)
+
+
+# 추적 시작 / 종료 (TracingMiddleware에서 사용)
+def start_trace() -> tuple[Trace, Token]:
+    trace = Trace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token: Token) -> None:
+    _current_trace.reset(token)
+
+
+class _Span:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.trace.add(self.name, self.start, time.perf_counter() - self.start)
+
+
+_NOOP_SPAN = nullcontext()
+
+
+# 구간 측정 컨텍스트 매니저
+# - 추적 중이 아니면 공유 no-op 객체를 반환하므로 비활성화 시 비용은 ContextVar 조회 한 번
+def span(name: str) -> Any:
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return _Span(trace, name)
+
+
+# 이미 측정한 구간 기록 (이벤트 훅 등 with 문으로 감쌀 수 없는 곳에서 사용)
+def record_span(name: str, start: float, duration: float) -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, start, duration)
+
+
+# 최근 느린 요청 Trace 링 버퍼
+class TraceBuffer:
+    def __init__(self, size: int):
+        self.recorded = 0
+        self._traces: deque[dict[str, Any]] = deque(maxlen=size)
+
+    def add(self, trace: dict[str, Any]) -> None:
+        self.recorded += 1
+        self._traces.append(trace)
+
+    # 처리 시간이 긴 순서로 최대 limit개 반환
+    def slowest(self, limit: int) -> list[dict[str, Any]]:
+        return sorted(self._traces, key=lambda t: t["duration_ms"], reverse=True)[
+            :limit
+        ]
+
+    def clear(self) -> None:
+        self._traces.clear()
+        self.recorded = 0
+
+
+# 엔진에 SQL 실행 구간 측정 이벤트 등록
+def install_sql_tracing(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None and _current_trace.get() is not None:
+            context._trace_start_time = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = getattr(context, "_trace_start_time", None)
+        if start is not None:
+            record_span("sql", start, time.perf_counter() - start)
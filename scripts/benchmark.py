@@ -0,0 +1,257 @@
+"""
+인프로세스 처리량 벤치마크
+
+uvicorn 없이 httpx ASGITransport로 앱을 직접 호출해서 엔드포인트별
+초당 요청 수(RPS)와 지연시간을 측정합니다.
+
+사용법 (프로젝트 루트에서, .env 또는 환경변수 설정 필요):
+    python scripts/benchmark.py me --requests 5000 --concurrency 50
+    python scripts/benchmark.py login-spike --requests 500 --concurrency 20
+    python scripts/benchmark.py import --requests 5000 --concurrency 20
+    python scripts/benchmark.py delete-user --requests 10000
+    python scripts/benchmark.py rps --requests 5000 --concurrency 50
+    python scripts/benchmark.py metrics --requests 5000 --concurrency 50
+    python scripts/benchmark.py tracing --requests 5000 --concurrency 50
+    python scripts/benchmark.py pages --requests 5000 --concurrency 50
+    python scripts/benchmark.py errors --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from config.db import AsyncSessionLocal, query_stats  # noqa: E402
+from config.settings import settings  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from main import app  # noqa: E402
+from models.enums import UserRole  # noqa: E402
+from models.user import User  # noqa: E402
+from services import import_service, jwt_service  # noqa: E402
+from services.auth_service import delete_user_async, password_pool  # noqa: E402
+from utils.path import templates  # noqa: E402
+
+
+# 지정한 요청을 동시성 concurrency로 total번 실행하고 결과 출력
+async def run(
+    label: str,
+    client: AsyncClient,
+    path: str,
+    total: int,
+    concurrency: int,
+    status: int = 200,
+):
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == status, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:<24} {total / elapsed:>10.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:>7.2f}ms  "
+        f"p99 {p99 * 1000:>7.2f}ms"
+    )
+
+
+# /me: 검증된 토큰 캐시 사용/미사용 비교
+async def bench_me(total: int, concurrency: int):
+    token = jwt_service.create_access_token(
+        "00000000-0000-0000-0000-000000000000", "bench", UserRole.MEMBER
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        client.cookies.set("access_token", token)
+
+        settings.TOKEN_CACHE_ENABLED = False
+        await run("/me (cache off)", client, "/me", total, concurrency)
+
+        settings.TOKEN_CACHE_ENABLED = True
+        jwt_service.verified_token_cache.clear()
+        await run("/me (cache on)", client, "/me", total, concurrency)
+        print(f"token cache: {jwt_service.verified_token_cache.stats()}")
+
+
+# 로그인 폭주 중 /health 지연시간
+# - bcrypt가 이벤트 루프를 막지 않으면 /health p99가 로그인 부하와 무관하게 유지됨
+async def bench_login_spike(total: int, concurrency: int):
+    username = f"bench-{uuid.uuid4().hex[:8]}"
+    credentials = {"username": username, "password": "bench1234!"}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/register", json=credentials)
+        assert response.status_code == 201, response.text
+        client.cookies.clear()
+
+        await run("/health (idle)", client, "/health", total, concurrency)
+
+        async def login_burst():
+            for _ in range(max(total // 20, 1)):
+                await asyncio.gather(
+                    *(client.post("/login", json=credentials) for _ in range(10))
+                )
+
+        burst = asyncio.create_task(login_burst())
+        await run("/health (login spike)", client, "/health", total, concurrency)
+        await burst
+        print(f"password hashing: {password_pool.stats()}")
+
+
+# 사용자 일괄 등록 처리량과 등록 중 /health 지연시간
+# - total명을 CSV로 등록하고, 그동안 /health를 total번 호출
+async def bench_import(total: int, concurrency: int):
+    prefix = f"imp-{uuid.uuid4().hex[:6]}"
+
+    async def body():
+        yield b"username,password\n"
+        for i in range(total):
+            yield f"{prefix}-{i},bench1234!\n".encode()
+
+    async def do_import():
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            report = await import_service.import_users(db, body(), "csv")
+        elapsed = time.perf_counter() - start
+        print(
+            f"{'import':<24} {report['imported'] / elapsed * 60:>10.0f} users/min  "
+            f"failed {report['failed']}"
+        )
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        task = asyncio.create_task(do_import())
+        await run("/health (during import)", client, "/health", total, concurrency)
+        await task
+        print(f"password hashing: {password_pool.stats()}")
+
+
+# 리프레시 토큰이 total개인 사용자 삭제 시간과 실행된 SQL 수
+async def bench_delete_user(total: int, concurrency: int):
+    async with AsyncSessionLocal() as db:
+        user = User(username=f"del-{uuid.uuid4().hex[:8]}", password="-")
+        db.add(user)
+        await db.flush()
+        db.add_all(jwt_service.build_refresh_token(user.id)[1] for _ in range(total))
+        await db.commit()
+        user_id = user.id
+
+    query_stats.clear()
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await delete_user_async(db, user_id)
+    elapsed = time.perf_counter() - start
+
+    statements = sum(q["count"] for q in query_stats.top(200))
+    print(
+        f"{'delete user':<24} {elapsed * 1000:>10.2f}ms  "
+        f"tokens {total}  statements {statements}"
+    )
+
+
+# /health, /me 처리량 (미들웨어 오버헤드 비교용)
+async def bench_rps(total: int, concurrency: int):
+    token = jwt_service.create_access_token(
+        "00000000-0000-0000-0000-000000000000", "bench", UserRole.MEMBER
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await run("/health", client, "/health", total, concurrency)
+        client.cookies.set("access_token", token)
+        await run("/me", client, "/me", total, concurrency)
+
+
+# 요청 메트릭 수집 오버헤드 (/health, 메트릭 수집 끔/켬)
+async def bench_metrics(total: int, concurrency: int):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for enabled in (False, True, False, True):
+            settings.METRICS_ENABLED = enabled
+            label = f"/health (metrics {'on' if enabled else 'off'})"
+            await run(label, client, "/health", total, concurrency)
+        response = await client.get("/metrics")
+        print(f"/metrics render: {len(response.content)} bytes")
+
+
+# 요청 구간 추적 오버헤드 (/me, 추적 끔/켬/Server-Timing 포함)
+async def bench_tracing(total: int, concurrency: int):
+    token = jwt_service.create_access_token(
+        "00000000-0000-0000-0000-000000000000", "bench", UserRole.MEMBER
+    )
+    settings.TRACE_SLOW_SECONDS = 0.0
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        client.cookies.set("access_token", token)
+        for enabled, server_timing, label in (
+            (False, False, "off"),
+            (True, False, "on"),
+            (True, True, "on + Server-Timing"),
+            (False, False, "off"),
+        ):
+            settings.TRACE_ENABLED = enabled
+            settings.TRACE_SERVER_TIMING = server_timing
+            await run(f"/me (tracing {label})", client, "/me", total, concurrency)
+
+
+# 렌더링된 페이지 캐시 효과 (/introduction, 캐시 끔/켬)
+async def bench_pages(total: int, concurrency: int):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for enabled in (False, True):
+            templates.page_cache_enabled = enabled
+            label = f"/introduction (page cache {'on' if enabled else 'off'})"
+            await run(label, client, "/introduction", total, concurrency)
+
+
+# 존재하지 않는 경로 요청 (봇 스캔) 처리량 (JSON / HTML 에러 응답)
+async def bench_errors(total: int, concurrency: int):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for accept in ("*/*", "text/html"):
+            client.headers["accept"] = accept
+            label = f"404 (Accept: {accept})"
+            await run(label, client, "/wp-login.php", total, concurrency, status=404)
+
+
+BENCHMARKS = {
+    "me": bench_me,
+    "login-spike": bench_login_spike,
+    "import": bench_import,
+    "delete-user": bench_delete_user,
+    "rps": bench_rps,
+    "metrics": bench_metrics,
+    "tracing": bench_tracing,
+    "pages": bench_pages,
+    "errors": bench_errors,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(BENCHMARKS[args.benchmark](args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -89,3 +89,18 @@ async def admin_user(async_client):
             response.cookies.get("access_token"),
             response.cookies.get("refresh_token"),
         )
+
+
+@pytest_asyncio.fixture
+async def admin_login(async_client, admin_user):
+    response = await async_client.post(
+        "/login", json={"username": "admin", "password": "admin1234!"}
+    )
+    assert response.status_code == 200, "관리자 로그인 실패"
+    async_client.cookies.set("access_token", response.cookies.get("access_token"))
+    async_client.cookies.set("refresh_token", response.cookies.get("refresh_token"))
+    try:
+        yield
+    finally:
+        async_client.cookies.delete("access_token")
+        async_client.cookies.delete("refresh_token")
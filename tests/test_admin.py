@@ -0,0 +1,265 @@
+import json
+import uuid
+from unittest.mock import patch
+
+import pytest
+from config.db import read_router  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_admin_stats(async_client, admin_login):
+    response = await async_client.get("/admin/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["db_pool"]["size"] >= 1
+    assert "checked_out" in stats["db_pool"]
+    assert "pending" in stats["password_hashing"]
+    assert list(stats["user_cache"]) == ["by_username"]
+
+
+@pytest.mark.asyncio
+async def test_admin_user_keyset_pagination(async_client, admin_login):
+    prefix = f"page-{uuid.uuid4().hex[:6]}"
+    for i in range(5):
+        await async_client.post(
+            "/register", json={"username": f"{prefix}-{i}", "password": "page1234!"}
+        )
+    # 회원가입 응답이 쿠키를 덮어쓰므로 관리자 쿠키 복원은 admin_login 대신 직접 재로그인
+    response = await async_client.post(
+        "/login", json={"username": "admin", "password": "admin1234!"}
+    )
+    async_client.cookies.set("access_token", response.cookies.get("access_token"))
+    async_client.cookies.set("refresh_token", response.cookies.get("refresh_token"))
+
+    usernames = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "username": prefix}
+        if cursor:
+            params["cursor"] = cursor
+        response = await async_client.get("/admin/user", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        usernames += [u["username"] for u in data["users"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert usernames == [f"{prefix}-{i}" for i in range(5)]
+
+    # 스트리밍은 읽기 세션(커넥션)을 하나만 사용
+    with patch.object(read_router, "session", wraps=read_router.session) as session:
+        response = await async_client.get(
+            "/admin/user", params={"username": prefix, "format": "ndjson"}
+        )
+    assert session.call_count == 1
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [u["username"] for u in lines] == usernames
+
+    response = await async_client.get("/admin/user", params={"cursor": "invalid"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_admin_user_batch(async_client, admin_login):
+    prefix = f"batch-{uuid.uuid4().hex[:6]}"
+    for i in range(3):
+        await async_client.post(
+            "/register", json={"username": f"{prefix}-{i}", "password": "batch1234!"}
+        )
+    response = await async_client.post(
+        "/login", json={"username": "admin", "password": "admin1234!"}
+    )
+    async_client.cookies.set("access_token", response.cookies.get("access_token"))
+    async_client.cookies.set("refresh_token", response.cookies.get("refresh_token"))
+
+    response = await async_client.get("/admin/user", params={"username": prefix})
+    ids = [u["id"] for u in response.json()["users"]]
+
+    response = await async_client.post(
+        "/admin/user/batch",
+        json={
+            "operations": [
+                {
+                    "op": "modify",
+                    "userid": ids[0],
+                    "attr": "role",
+                    "attr_type": "str",
+                    "value": "manager",
+                },
+                {
+                    "op": "modify",
+                    "userid": ids[1],
+                    "attr": "role",
+                    "attr_type": "str",
+                    "value": "manager",
+                },
+                {"op": "delete", "userid": ids[2]},
+                {
+                    "op": "modify",
+                    "userid": ids[2],
+                    "attr": "role",
+                    "attr_type": "str",
+                    "value": "admin",
+                },
+                {"op": "delete", "userid": "missing"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["applied"] == 3
+    assert [r["status"] for r in data["results"]] == [
+        "success",
+        "success",
+        "success",
+        "error",
+        "error",
+    ]
+
+    response = await async_client.get("/admin/user", params={"username": prefix})
+    users = response.json()["users"]
+    assert [u["role"] for u in users] == ["manager", "manager"]
+
+    # 하나라도 잘못된 항목이 있으면 아무것도 적용하지 않음
+    response = await async_client.post(
+        "/admin/user/batch",
+        json={
+            "operations": [
+                {"op": "delete", "userid": ids[0]},
+                {
+                    "op": "modify",
+                    "userid": ids[1],
+                    "attr": "password",
+                    "attr_type": "str",
+                    "value": "x",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 422
+    response = await async_client.get("/admin/user", params={"username": prefix})
+    assert len(response.json()["users"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_admin_user_import(async_client, admin_login):
+    prefix = f"imp-{uuid.uuid4().hex[:6]}"
+    rows = [
+        "username,password",
+        f"{prefix}-0,import1234!",
+        f"{prefix}-1,import1234!",
+        f"{prefix}-1,import1234!",
+        "admin,import1234!",
+        f"{prefix}-2,short",
+        f"{prefix}-3",
+    ]
+    response = await async_client.post(
+        "/admin/user/import", content="\n".join(rows).encode()
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["total"] == 6
+    assert report["imported"] == 2
+    assert [e["row"] for e in report["errors"]] == [3, 4, 5, 6]
+
+    lines = [
+        json.dumps({"username": f"{prefix}-4", "password": "import1234!"}),
+        "not json",
+    ]
+    response = await async_client.post(
+        "/admin/user/import",
+        params={"format": "ndjson"},
+        content="\n".join(lines).encode(),
+    )
+    assert response.json()["imported"] == 1
+    assert [e["row"] for e in response.json()["errors"]] == [2]
+
+    response = await async_client.post(
+        "/login", json={"username": f"{prefix}-4", "password": "import1234!"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_user_import_hashes_outside_transaction():
+    from conftest import get_async_db
+    from services import import_service  # type: ignore
+
+    hash_passwords = import_service._hash_passwords
+    async with get_async_db() as db:
+
+        # 해시하는 동안 세션이 트랜잭션(커넥션)을 잡고 있지 않아야 함
+        async def check_and_hash(passwords):
+            assert not db.in_transaction()
+            return await hash_passwords(passwords)
+
+        async def body():
+            yield f"username,password\nimp-{uuid.uuid4().hex[:6]},import1234!".encode()
+
+        with patch.object(import_service, "_hash_passwords", check_and_hash):
+            report = await import_service.import_users(db, body(), "csv")
+    assert report["imported"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(async_client, admin_login):
+    from utils import deps  # type: ignore
+
+    await async_client.get("/health")
+    response = await async_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health"' in body
+    assert 'db_pool_connections{state="checked_out"}' in body
+    assert 'cache_hit_ratio{cache="verified_token"}' in body
+    assert "password_hash_pending" in body
+
+    # 허용 네트워크 밖에서는 관리자만 접근 가능
+    with patch.object(deps, "_metrics_networks", []):
+        assert (await async_client.get("/metrics")).status_code == 200
+        async_client.cookies.clear()
+        assert (await async_client.get("/metrics")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_request_tracing(async_client, admin_login):
+    from config.settings import settings  # type: ignore
+    from utils.path import templates  # type: ignore
+
+    response = await async_client.get("/me")
+    assert "server-timing" not in response.headers
+    templates.pages.clear()
+
+    with (
+        patch.object(settings, "TRACE_ENABLED", True),
+        patch.object(settings, "TRACE_SERVER_TIMING", True),
+        patch.object(settings, "TRACE_SLOW_SECONDS", 0.0),
+    ):
+        response = await async_client.get("/me")
+        timing = response.headers["server-timing"]
+        assert "jwt;dur=" in timing and "total;dur=" in timing
+
+        # 로그인: bcrypt, 커넥션 checkout, SQL 구간
+        response = await async_client.post(
+            "/login", json={"username": "admin", "password": "admin1234!"}
+        )
+        timing = response.headers["server-timing"]
+        for name in ("bcrypt", "db_checkout", "sql"):
+            assert f"{name};dur=" in timing
+
+        response = await async_client.get("/admin/")
+        assert "template;dur=" in response.headers["server-timing"]
+
+        response = await async_client.get("/admin/traces", params={"limit": 50})
+        assert response.status_code == 200
+        traces = response.json()["traces"]
+        login = next(
+            t for t in traces if t["route"] == "/login" and t["method"] == "POST"
+        )
+        assert login["totals"]["bcrypt"]["count"] == 1
+        assert login["spans"][0]["start_ms"] >= 0
+        durations = [t["duration_ms"] for t in traces]
+        assert durations == sorted(durations, reverse=True)
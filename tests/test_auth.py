@@ -145,8 +145,99 @@ async def test_login_after_delete_account(async_client, create_user_and_login):
     assert response.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_delete_account_cascades_refresh_tokens(
+    async_client, create_user_and_login
+):
+    from conftest import get_async_db
+    from services import jwt_service  # type: ignore
+
+    _, _, _, refresh_token = create_user_and_login
+    response = await async_client.delete("/delete_account")
+    assert response.status_code == 200
+    async with get_async_db() as db:
+        assert await jwt_service.get_refresh_token_async(db, refresh_token) is None
+
+
 @pytest.mark.asyncio
 async def test_admin_page_without_admin(async_client, create_user_and_login):
     username, _, _, _ = create_user_and_login
     response = await async_client.get("/admin/")
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_stored_as_digest(async_client, create_user_and_login):
+    from conftest import get_async_db
+    from services import jwt_service  # type: ignore
+
+    _, _, _, refresh_token = create_user_and_login
+    async with get_async_db() as db:
+        db_token = await jwt_service.get_refresh_token_async(db, refresh_token)
+    assert db_token is not None
+    assert db_token.token_hash == jwt_service.token_digest(refresh_token)
+    assert len(db_token.token_hash) == 64
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_rotates_only_once(
+    async_client, create_user_and_login
+):
+    import asyncio
+
+    from conftest import get_async_db
+    from services import jwt_service  # type: ignore
+
+    _, _, _, refresh_token = create_user_and_login
+
+    async def refresh():
+        async with get_async_db() as db:
+            return await jwt_service.refresh_access_token_async(db, refresh_token)
+
+    results = await asyncio.gather(*(refresh() for _ in range(10)))
+    succeeded = [r for r in results if r is not None]
+    assert len(succeeded) == 1, "같은 refresh token으로 여러 번 갱신됨"
+
+    async with get_async_db() as db:
+        old_token = await jwt_service.get_refresh_token_async(db, refresh_token)
+        new_token = await jwt_service.get_refresh_token_async(db, succeeded[0][1])
+    assert old_token.revoked
+    assert new_token is not None and not new_token.revoked
+
+
+@pytest.mark.asyncio
+async def test_parallel_requests_share_single_refresh(create_user_and_login):
+    import asyncio
+
+    from httpx import ASGITransport, AsyncClient
+
+    _, _, _, refresh_token = create_user_and_login
+    expired_access_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiJ0ZXN0IiwidXNlcm5hbWUiOiJ0ZXN0IiwiaXNfYWRtaW4iOmZhbHNlLCJleHAiOjEwMDAwMDAwMDAsInR5cGUiOiJhY2Nlc3MiLCJpYXQiOjEwMDAwMDAwMDB9.signature"
+    headers = {
+        "Cookie": f"access_token={expired_access_token}; refresh_token={refresh_token}"
+    }
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.get("/me", headers=headers) for _ in range(5))
+        )
+        # 회전 직후 이전 토큰으로 들어온 요청도 같은 토큰 쌍을 받음
+        responses.append(await client.get("/me", headers=headers))
+
+    assert all(r.status_code == 200 for r in responses)
+    new_refresh_tokens = {r.cookies.get("refresh_token") for r in responses}
+    assert len(new_refresh_tokens) == 1
+    assert refresh_token not in new_refresh_tokens
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_does_not_touch_db(
+    async_client, create_user_and_login
+):
+    from config.db import lazy_session_stats  # type: ignore
+
+    untouched = lazy_session_stats["untouched"]
+    response = await async_client.get("/me")
+    assert response.status_code == 200
+    assert lazy_session_stats["untouched"] == untouched + 1
@@ -0,0 +1,125 @@
+import time
+
+from models.enums import UserRole  # type: ignore
+from services import jwt_service  # type: ignore
+from utils.cache import TTLCache  # type: ignore
+from utils.deps import decode_token  # type: ignore
+
+
+def test_ttl_cache_expiry_and_lru():
+    cache: TTLCache[int] = TTLCache(max_size=2)
+    cache.set("expired", 1, expires_at=time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # 가장 오래 사용되지 않은 "b" 제거
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["size"] == 2
+
+
+def test_decode_token_uses_verified_token_cache():
+    token = jwt_service.create_access_token(
+        "cache-test-user", "cachetest", UserRole.MEMBER
+    )
+    jwt_service.verified_token_cache.clear()
+    hits = jwt_service.verified_token_cache.hits
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert first.username == "cachetest"
+    assert second is first
+    assert jwt_service.verified_token_cache.hits == hits + 1
+
+
+async def _register(async_client, password="cache1234!"):
+    import uuid
+
+    username = f"cache-{uuid.uuid4().hex[:8]}"
+    response = await async_client.post(
+        "/register", json={"username": username, "password": password}
+    )
+    assert response.status_code == 201
+    async_client.cookies.clear()
+    return username
+
+
+async def test_user_cache_invalidated_by_admin_update_and_delete(async_client):
+    from conftest import get_async_db
+    from services import admin_service, auth_service  # type: ignore
+
+    username = await _register(async_client)
+    async with get_async_db() as db:
+        user = await auth_service.get_cached_user_by_username_async(db, username)
+        hits = auth_service.user_cache_by_username.hits
+        cached = await auth_service.get_cached_user_by_username_async(db, username)
+        assert auth_service.user_cache_by_username.hits == hits + 1
+        assert cached.id == user.id
+        assert cached.password is None, "password는 기본적으로 캐시하지 않음"
+
+        await admin_service.db_update(db, user.id, {"role": UserRole.MANAGER})
+        updated = await auth_service.get_cached_user_by_username_async(db, username)
+        assert updated.role == UserRole.MANAGER
+
+        await admin_service.db_delete(db, user.id)
+        assert auth_service.user_cache_by_id.peek(user.id) is None
+        assert (
+            await auth_service.get_cached_user_by_username_async(db, username) is None
+        )
+
+
+async def test_login_does_not_count_cache_hit_without_password(async_client):
+    from conftest import get_async_db
+    from services import auth_service  # type: ignore
+
+    username = await _register(async_client)
+    async with get_async_db() as db:
+        await auth_service.get_cached_user_by_username_async(db, username)
+        assert auth_service.user_cache_by_username.peek(username) is not None
+
+        hits = auth_service.user_cache_by_username.hits
+        misses = auth_service.user_cache_by_username.misses
+        user = await auth_service.authenticate_user_async(db, username, "cache1234!")
+        assert user is not None
+        assert auth_service.user_cache_by_username.hits == hits
+        assert auth_service.user_cache_by_username.misses == misses
+
+
+async def test_user_cache_invalidated_by_change_password(async_client):
+    from config.settings import settings  # type: ignore
+    from conftest import get_async_db
+    from services import auth_service  # type: ignore
+
+    exclude_fields = settings.USER_CACHE_EXCLUDE_FIELDS
+    settings.USER_CACHE_EXCLUDE_FIELDS = ""  # password까지 캐시
+    try:
+        username = await _register(async_client)
+        async with get_async_db() as db:
+            user = await auth_service.authenticate_user_async(
+                db, username, "cache1234!"
+            )
+            assert user is not None
+            assert auth_service.user_cache_by_username.peek(username).password
+
+            await auth_service.change_password_async(
+                db, user.id, "cache1234!", "changed1234!"
+            )
+            assert (
+                await auth_service.authenticate_user_async(db, username, "cache1234!")
+                is None
+            )
+            assert await auth_service.authenticate_user_async(
+                db, username, "changed1234!"
+            )
+
+            await auth_service.delete_user_async(db, user.id)
+            assert (
+                await auth_service.authenticate_user_async(db, username, "changed1234!")
+                is None
+            )
+    finally:
+        settings.USER_CACHE_EXCLUDE_FIELDS = exclude_fields
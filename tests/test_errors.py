@@ -0,0 +1,78 @@
+import pytest
+from utils.error_handlers import ErrorLogAggregator, error_log  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_error_response_negotiates_json(async_client):
+    response = await async_client.get("/no-such-path", headers={"Accept": "*/*"})
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": "Not Found"}
+
+    async_client.cookies.clear()
+    response = await async_client.get("/me", headers={"Accept": "application/json"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Please login"}
+
+    response = await async_client.get("/no-such-path", headers={"Accept": "text/html"})
+    assert response.status_code == 404
+    assert response.headers["content-type"].startswith("text/html")
+    assert "404" in response.text
+
+
+@pytest.mark.asyncio
+async def test_error_logs_aggregated(async_client):
+    error_log.flush()
+    for _ in range(3):
+        await async_client.get("/scan/wp-login.php")
+    await async_client.get("/scan/.env")
+    assert error_log.counts[(404, "/scan/wp-login.php")] == 3
+    assert error_log.counts[(404, "/scan/.env")] == 1
+
+
+def test_error_log_aggregator_bounds_paths(caplog):
+    aggregator = ErrorLogAggregator(interval=3600, max_paths=2)
+    for path in ("/a", "/b", "/c", "/d", "/a"):
+        aggregator.record(404, path)
+    assert aggregator.counts == {(404, "/a"): 2, (404, "/b"): 1, (404, "<other>"): 2}
+
+    aggregator.flush()
+    assert aggregator.counts == {}
+    assert "에러 응답 5건" in caplog.text
+    assert "404 /a x2" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_error_log_aggregator_flushes_periodically(caplog):
+    import asyncio
+
+    aggregator = ErrorLogAggregator(interval=0.05, max_paths=10)
+    task = asyncio.create_task(aggregator.run())
+    try:
+        # 이후 에러가 없어도 다음 주기에 기록
+        aggregator.record(401, "/me")
+        await asyncio.sleep(0.15)
+        assert "401 /me x1" in caplog.text
+        assert aggregator.counts == {}
+    finally:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_error_headers_forwarded_to_html_and_json(async_client):
+    from fastapi import HTTPException  # type: ignore
+    from main import app  # type: ignore
+
+    @app.get("/test-www-authenticate", include_in_schema=False)
+    async def www_authenticate():
+        raise HTTPException(401, "Please login", headers={"WWW-Authenticate": "Bearer"})
+
+    try:
+        for accept in ("text/html", "application/json"):
+            response = await async_client.get(
+                "/test-www-authenticate", headers={"Accept": accept}
+            )
+            assert response.status_code == 401
+            assert response.headers["www-authenticate"] == "Bearer"
+    finally:
+        app.router.routes.pop()
@@ -0,0 +1,51 @@
+import gzip
+import json
+import logging
+
+from utils.logger import (  # type: ignore
+    JsonFormatter,
+    SamplingFilter,
+    _gzip_namer,
+    _gzip_rotator,
+    parse_sample_rates,
+)
+
+
+def _record(name: str, level: int = logging.INFO, msg: str = "hello %s"):
+    return logging.LogRecord(name, level, __file__, 1, msg, ("world",), None)
+
+
+def test_sampling_filter_uses_longest_prefix():
+    sampling = SamplingFilter(parse_sample_rates("app=1, app.main=0"))
+    assert sampling.filter(_record("app.db"))
+    assert not sampling.filter(_record("app.main"))
+    assert not sampling.filter(_record("app.main.sub"))
+    assert sampling.filter(_record("app.mainframe"))
+    # WARNING 이상은 샘플링하지 않음
+    assert sampling.filter(_record("app.main", logging.ERROR))
+
+
+def test_json_formatter_formats_lazily():
+    line = JsonFormatter().format(_record("app.main"))
+    data = json.loads(line)
+    assert data["msg"] == "hello world"
+    assert data["logger"] == "app.main"
+    assert "\n" not in line
+
+
+def test_gzip_rotator(tmp_path):
+    source = tmp_path / "app.log.1"
+    source.write_text("line\n")
+    dest = _gzip_namer(str(source))
+    _gzip_rotator(str(source), dest)
+    assert not source.exists()
+    with gzip.open(dest, "rt") as f:
+        assert f.read() == "line\n"
+
+
+def test_instrumented_pool_logger_follows_sqlalchemy_pool_level():
+    from config.db import async_engine  # type: ignore
+
+    # SQLAlchemy가 풀 로그에 사용하는 로거 ("Pool disposed" 등)
+    pool_logger = async_engine.pool.logger
+    assert not pool_logger.isEnabledFor(logging.INFO)
@@ -0,0 +1,207 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from config.db import async_engine  # type: ignore
+from conftest import get_async_db
+from models.refresh_token import RefreshToken  # type: ignore
+from models.user import User  # type: ignore
+from services import jwt_service, maintenance_service  # type: ignore
+from sqlalchemy import func, select, text
+from utils.partitioning import list_partitions_sql  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_tokens_in_batches(create_user_and_login):
+    username, _, _, _ = create_user_and_login
+    async with get_async_db() as db:
+        user = await db.scalar(select(User).filter(User.username == username))
+        past = datetime.now(timezone.utc) - timedelta(days=1)
+        hashes = []
+        for i in range(5):
+            _, db_token = jwt_service.build_refresh_token(user.id)
+            if i % 2:
+                db_token.revoked = True
+            else:
+                db_token.expires_at = past
+            db.add(db_token)
+            hashes.append(db_token.token_hash)
+        await db.commit()
+
+        purged = await jwt_service.cleanup_expired_tokens_async(db, batch_size=2)
+        assert purged >= 5
+        remaining = await db.scalar(
+            select(func.count())
+            .select_from(RefreshToken)
+            .filter(RefreshToken.token_hash.in_(hashes))
+        )
+        assert remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_purge_tokens_once_skips_when_locked():
+    async with async_engine.connect() as conn:
+        await conn.execute(
+            select(func.pg_advisory_lock(maintenance_service.TOKEN_PURGE_LOCK_KEY))
+        )
+        try:
+            assert await maintenance_service.purge_tokens_once() is None
+        finally:
+            await conn.execute(
+                select(
+                    func.pg_advisory_unlock(maintenance_service.TOKEN_PURGE_LOCK_KEY)
+                )
+            )
+
+    assert await maintenance_service.purge_tokens_once() is not None
+
+
+@pytest.mark.asyncio
+async def test_purge_tokens_once_releases_lock_after_failure():
+    from sqlalchemy.exc import ProgrammingError
+
+    # 파티션 관리 중 트랜잭션이 중단된 상태로 실패해도 원래 오류가 전달되고 lock이 풀려야 함
+    async def fail(conn):
+        await conn.execute(text("DROP TABLE missing_partition"))
+
+    with (
+        patch.object(
+            maintenance_service, "is_partitioned_sql", lambda _: "SELECT true"
+        ),
+        patch.object(maintenance_service, "maintain_token_partitions", fail),
+        pytest.raises(ProgrammingError),
+    ):
+        await maintenance_service.purge_tokens_once()
+
+    assert await maintenance_service.purge_tokens_once() is not None
+
+
+@pytest.mark.asyncio
+async def test_maintain_token_partitions_creates_and_drops():
+    today = datetime.now(timezone.utc).date()
+    old = f"partition_test_d{today - timedelta(days=3):%Y%m%d}"
+    async with async_engine.connect() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE partition_test (id int, expires_at timestamptz)"
+                " PARTITION BY RANGE (expires_at)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE TABLE {old} PARTITION OF partition_test FOR VALUES"
+                f" FROM ('{today - timedelta(days=3)}') TO ('{today - timedelta(days=2)}')"
+            )
+        )
+        await conn.commit()
+        try:
+            # 구간 단위(day)는 기존 파티션 이름에서 읽음
+            created, dropped, purged = (
+                await maintenance_service.maintain_token_partitions(
+                    conn, "partition_test"
+                )
+            )
+            assert (dropped, purged) == (1, 0)
+            assert created > 0
+            partitions = set(
+                (
+                    await conn.execute(text(list_partitions_sql("partition_test")))
+                ).scalars()
+            )
+            assert old not in partitions
+            assert f"partition_test_d{today:%Y%m%d}" in partitions
+
+            # 이미 있는 파티션은 다시 만들지 않음
+            assert await maintenance_service.maintain_token_partitions(
+                conn, "partition_test"
+            ) == (0, 0, 0)
+        finally:
+            await conn.execute(text("DROP TABLE partition_test"))
+            await conn.commit()
+
+
+@pytest.mark.asyncio
+async def test_maintain_token_partitions_moves_and_purges_default_rows():
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    async with async_engine.connect() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE partition_test (id int, expires_at timestamptz)"
+                " PARTITION BY RANGE (expires_at)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE TABLE partition_test_d{today:%Y%m%d} PARTITION OF"
+                f" partition_test FOR VALUES"
+                f" FROM ('{today}') TO ('{today + timedelta(days=1)}')"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE TABLE partition_test_default PARTITION OF partition_test DEFAULT"
+            )
+        )
+        # 만료된 행 1개, 아직 파티션이 없는 범위의 행 1개
+        await conn.execute(
+            text("INSERT INTO partition_test VALUES (1, :expired), (2, :future)"),
+            {"expired": now - timedelta(days=2), "future": now + timedelta(days=2)},
+        )
+        await conn.commit()
+        try:
+            created, _, purged = await maintenance_service.maintain_token_partitions(
+                conn, "partition_test"
+            )
+            assert created > 0
+            assert purged == 1
+            future = f"partition_test_d{today + timedelta(days=2):%Y%m%d}"
+            assert await conn.scalar(text(f"SELECT id FROM {future}")) == 2
+            assert (
+                await conn.scalar(text("SELECT count(*) FROM partition_test_default"))
+                == 0
+            )
+        finally:
+            await conn.execute(text("DROP TABLE partition_test"))
+            await conn.commit()
+
+
+async def _token_hash_index() -> str:
+    async with async_engine.connect() as conn:
+        return await conn.scalar(
+            text(
+                "SELECT indexdef FROM pg_indexes"
+                " WHERE indexname = 'ix_refresh_tokens_token_hash'"
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_partition_and_unpartition_token_table(create_user_and_login):
+    _, _, _, refresh_token = create_user_and_login
+    # 일반 테이블에서는 token_hash 단독 unique
+    assert "(token_hash)" in await _token_hash_index()
+
+    assert await maintenance_service.partition_token_table("week") is not None
+    try:
+        assert await maintenance_service.partition_token_table("week") is None
+        async with async_engine.connect() as conn:
+            partitions = set(
+                (
+                    await conn.execute(text(list_partitions_sql("refresh_tokens")))
+                ).scalars()
+            )
+        assert "refresh_tokens_default" in partitions
+        assert len(partitions) > 1
+        assert "(token_hash, expires_at)" in await _token_hash_index()
+
+        async with get_async_db() as db:
+            assert await jwt_service.get_refresh_token_async(db, refresh_token)
+        assert await maintenance_service.purge_tokens_once() is not None
+    finally:
+        assert await maintenance_service.unpartition_token_table() is not None
+
+    assert await maintenance_service.unpartition_token_table() is None
+    assert "(token_hash)" in await _token_hash_index()
+    async with get_async_db() as db:
+        assert await jwt_service.get_refresh_token_async(db, refresh_token)
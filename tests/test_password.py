@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+import pytest
+from services import auth_service  # type: ignore
+from utils.process_pool import BoundedProcessPool, PoolBusyError  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_password_hash_async_roundtrip():
+    hashed = await auth_service.get_password_hash_async("hash1234!")
+    assert await auth_service.verify_password_async("hash1234!", hashed)
+    assert not await auth_service.verify_password_async("wrong1234!", hashed)
+    assert auth_service.password_pool.stats()["completed"] >= 3
+
+
+@pytest.mark.asyncio
+async def test_process_pool_rejects_when_full():
+    pool = BoundedProcessPool(max_workers=1, max_queue=0)
+    try:
+        running = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(PoolBusyError):
+            await pool.run(time.sleep, 0)
+        await running
+        assert pool.stats()["rejected"] == 1
+    finally:
+        pool.shutdown()
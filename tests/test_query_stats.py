@@ -0,0 +1,18 @@
+import pytest
+from utils.query_stats import normalize_sql, redact_parameters  # type: ignore
+
+
+def test_normalize_sql_and_redact_parameters():
+    sql = normalize_sql("SELECT *\n  FROM users WHERE id IN ($1, $2, $3) AND x = $4")
+    assert sql == "SELECT * FROM users WHERE id IN (?...) AND x = ?"
+    assert redact_parameters(("secret", 1)) == ("<str>", "<int>")
+
+
+@pytest.mark.asyncio
+async def test_admin_query_stats(async_client, admin_login):
+    response = await async_client.get("/admin/stats/queries", params={"limit": 5})
+    assert response.status_code == 200
+    queries = response.json()["queries"]
+    assert 0 < len(queries) <= 5
+    assert all("$1" not in q["sql"] for q in queries)
+    assert queries[0]["total"] >= queries[-1]["total"]
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from utils.static_assets import static_assets  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_templates_use_hashed_asset_urls(async_client):
+    response = await async_client.get("/introduction")
+    assert response.status_code == 200
+    assert static_assets.url("css/base.css") in response.text
+    assert 'href="/static/css/base.css"' not in response.text
+    # JS 모듈의 상대 경로 import도 해시 URL로 연결
+    assert '"importmap"' in response.text
+    assert static_assets.url("js/form-utils.js") in response.text
+
+
+@pytest.mark.asyncio
+async def test_hashed_asset_is_immutable_and_precompressed(async_client):
+    url = static_assets.url("js/validators.js")
+    response = await async_client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "export" in response.text
+
+    # 압축본과 원본은 서로 다른 강한 ETag
+    identity = await async_client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != response.headers["etag"]
+    assert not identity.headers["etag"].startswith("W/")
+
+    # 조건부 요청 → 304
+    response = await async_client.get(
+        url,
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_unhashed_asset_revalidates(async_client):
+    response = await async_client.get("/static/css/base.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["content-type"] == "text/css; charset=utf-8"
+
+    response = await async_client.get(
+        "/static/css/base.css", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+    assert (await async_client.get("/static/css/missing.css")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_service_worker_serves_versioned_precache_manifest(async_client):
+    response = await async_client.get("/service-worker.js")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/javascript")
+    assert response.headers["cache-control"] == "no-cache"
+    prelude = response.text.split("\n", 1)[0]
+    manifest = json.loads(prelude.removeprefix("self.__SW_MANIFEST = ").rstrip(";"))
+    assert response.headers["etag"] == f'"{manifest["version"]}"'
+    assert "/" in manifest["precache"]
+    assert static_assets.url("css/base.css") in manifest["precache"]
+
+    response = await async_client.get(
+        "/service-worker.js", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
@@ -0,0 +1,57 @@
+import pytest
+from utils.path import templates  # type: ignore
+
+
+def test_templates_precompiled():
+    loaded = {template.name for template in templates.env.cache.values()}
+    assert {"base.html", "index.html", "error.html"} <= loaded
+
+
+@pytest.mark.asyncio
+async def test_rendered_page_cache_etag(async_client):
+    templates.pages.clear()
+    first = await async_client.get("/introduction")
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+
+    second = await async_client.get("/introduction")
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+    assert templates.pages.stats()["hits"] >= 1
+
+    response = await async_client.get("/introduction", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_error_pages_cached_per_context_keys(async_client):
+    templates.pages.clear()
+    html = {"Accept": "text/html,application/xhtml+xml,*/*;q=0.8"}
+    not_found = await async_client.get("/no-such-page", headers=html)
+    assert not_found.status_code == 404
+    assert "etag" not in not_found.headers
+    key = (
+        "error.html",
+        (404, "페이지를 찾을 수 없습니다", "요청하신 페이지가 존재하지 않습니다."),
+    )
+    assert templates.pages.peek(key) is not None
+
+    async_client.cookies.clear()
+    unauthorized = await async_client.get("/mypage/", headers=html)
+    assert unauthorized.status_code == 401
+    assert unauthorized.text != not_found.text
+    assert len(templates.pages) == 2
+
+
+@pytest.mark.asyncio
+async def test_page_cache_disabled_with_auto_reload(async_client):
+    templates.configure(auto_reload=True, page_cache_size=256)
+    try:
+        response = await async_client.get("/introduction")
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert len(templates.pages) == 0
+    finally:
+        templates.configure(auto_reload=False, page_cache_size=256)